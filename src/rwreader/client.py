@@ -16,7 +16,6 @@ from readwise.api import ReadwiseReader
 from readwise.model import Document
 
 from .exceptions import (
-    ArticleError,
     ReadwiseAuthenticationError,
     ReadwiseRateLimitError,
     ReadwiseServerError,
@@ -25,6 +24,10 @@ from .exceptions import (
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 _MAX_ARTICLE_ID_LENGTH = 100
+_DEFAULT_TIMEFRAME_DAYS = 30
+_TIMEFRAME_DAYS: dict[str, int] = {"day": 1, "week": 7, "month": 31, "year": 365}
+# Next longer archive timeframe to try when loading more articles
+_NEXT_TIMEFRAME: dict[str, str] = {"day": "week", "week": "month", "month": "year"}
 
 
 def _handle_api_error(error: Exception, article_id: str) -> None:
@@ -161,32 +164,46 @@ class ReadwiseClient:
         )
 
     def get_feed(
-        self, refresh: bool = False, limit: int | None = None
+        self,
+        refresh: bool = False,
+        limit: int | None = None,
+        filter_unread: bool = False,
     ) -> list[dict[str, Any]]:
         """Get articles in the Feed.
 
         Args:
             refresh: Force refresh even if cached data exists
             limit: Maximum number of items to return
+            filter_unread: Only return articles that have not been opened
 
         Returns:
             List of feed articles in dict format
         """
         return self._get_category(
-            cache_key="feed", api_location="feed", refresh=refresh, limit=limit
+            cache_key="feed",
+            api_location="feed",
+            refresh=refresh,
+            limit=limit,
+            filter_unread=filter_unread,
         )
 
-    def get_feed_with_retry(self, limit: int | None = None) -> list[dict[str, Any]]:
+    def get_feed_with_retry(
+        self, limit: int | None = None, filter_unread: bool = False
+    ) -> list[dict[str, Any]]:
         """Get feed articles with retry polling to handle server-side caching.
 
         Args:
             limit: Maximum number of items to return
+            filter_unread: Only return articles that have not been opened
 
         Returns:
             List of feed articles in dict format
         """
         return self._get_category_with_retry(
-            cache_key="feed", api_location="feed", limit=limit
+            cache_key="feed",
+            api_location="feed",
+            limit=limit,
+            filter_unread=filter_unread,
         )
 
     def get_later(
@@ -292,6 +309,7 @@ class ReadwiseClient:
         cache_key: str,
         api_location: str,
         limit: int | None = None,
+        filter_unread: bool = False,
     ) -> list[dict[str, Any]]:
         """Get articles with retry polling to handle server-side caching.
 
@@ -303,6 +321,7 @@ class ReadwiseClient:
             cache_key: Category key for cache (inbox, feed, later)
             api_location: Location value for readwise-api (new, feed, later)
             limit: Maximum number of items to return
+            filter_unread: Only return articles that have not been opened
 
         Returns:
             List of articles in dict format
@@ -321,6 +340,7 @@ class ReadwiseClient:
                 api_location=api_location,
                 refresh=True,
                 limit=limit,
+                filter_unread=filter_unread,
             )
             current_count = len(articles)
 
@@ -353,19 +373,11 @@ class ReadwiseClient:
         Returns:
             A datetime representing the start of the timeframe
         """
-        now: datetime.datetime = datetime.datetime.now()
-
-        if timeframe == "day":
-            return now - datetime.timedelta(days=1)
-        elif timeframe == "week":
-            return now - datetime.timedelta(days=7)
-        elif timeframe == "month":
-            return now - datetime.timedelta(days=31)
-        elif timeframe == "year":
-            return now - datetime.timedelta(days=365)
-        else:
+        days = _TIMEFRAME_DAYS.get(timeframe)
+        if days is None:
             logger.warning(msg=f"Invalid timeframe: {timeframe}, using month")
-            return now - datetime.timedelta(days=30)
+            days = _DEFAULT_TIMEFRAME_DAYS
+        return datetime.datetime.now() - datetime.timedelta(days=days)
 
     def _get_category(
         self,
@@ -373,6 +385,7 @@ class ReadwiseClient:
         api_location: str,
         refresh: bool = False,
         limit: int | None = None,
+        filter_unread: bool = False,
     ) -> list[dict[str, Any]]:
         """Get articles for a specific category with improved caching and performance.
 
@@ -381,12 +394,19 @@ class ReadwiseClient:
             api_location: Location value for readwise-api (new, feed, later)
             refresh: Force refresh even if cached data exists
             limit: Maximum number of items to return
+            filter_unread: Only return articles that have not been opened. The
+                filter is applied before the limit so a page is always full
 
         Returns:
             List of articles in dict format
         """
         cache: dict[str, Any] = self._category_cache[cache_key]
 
+        def select(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            if filter_unread:
+                articles = [a for a in articles if a.get("first_opened_at") == ""]
+            return articles[:limit] if limit else articles
+
         # CACHING DISABLED: Always fetch fresh data to prevent stale counts
         # Previous caching logic caused issues with counts not updating after moves
         # current_time: float = time.time()
@@ -394,7 +414,7 @@ class ReadwiseClient:
         # Only use cache if: not refreshing, has data, and not expired
         # if not refresh and cache["data"] and cache_age < self._cache_expiry:
         #     data = cast(list[dict[str, Any]], cache["data"])
-        #     return data[:limit] if limit else data
+        #     return select(data)
 
         # Get fresh data from the API
         current_time: float = time.time()
@@ -430,7 +450,7 @@ class ReadwiseClient:
                 logger.debug(
                     f"Returning {len(articles)} articles for {cache_key} (limit={limit})"
                 )
-                return articles[:limit] if limit else articles
+                return select(articles)
 
             except Exception as e:
                 error_msg = str(e).lower()
@@ -462,7 +482,7 @@ class ReadwiseClient:
                     # For non-critical errors (404, network issues, etc.), return cached data (even if empty)
                     # This preserves backward compatibility
                     data = cast(list[dict[str, Any]], cache["data"])
-                    return data[:limit] if limit else data
+                    return select(data)
 
         except (
             ReadwiseAuthenticationError,
@@ -476,7 +496,7 @@ class ReadwiseClient:
             # Return cached data (even if empty) for unexpected errors
             # This maintains backward compatibility with the original behavior
             data = cast(list[dict[str, Any]], cache["data"])
-            return data[:limit] if limit else data
+            return select(data)
 
     def _convert_document_to_dict(self, document: Any) -> dict[str, Any]:
         """Convert a Document object from readwise-api to a dictionary format.
@@ -518,25 +538,19 @@ class ReadwiseClient:
             return article_dict
         except Exception as e:
             logger.error(msg=f"Error converting document to dict: {e}")
-            # Try to create a minimal fallback dictionary
-            try:
-                return {
-                    "id": getattr(document, "id", "unknown"),
-                    "title": getattr(document, "title", "Error Loading Document"),
-                    "url": getattr(document, "url", ""),
-                    "archived": getattr(document, "location", "") == "archive",
-                    "saved_for_later": getattr(document, "location", "") == "later",
-                    "read": False,
-                    "state": "reading",
-                }
-            except Exception as nested_e:
-                logger.error(
-                    f"Severe error in fallback dictionary creation: {nested_e}"
-                )
-                # Raise ArticleError if we can't even create a fallback
-                raise ArticleError(
-                    f"Failed to convert document to dictionary: {e}"
-                ) from e
+            # Minimal fallback. getattr defaults only cover missing attributes;
+            # an attribute whose lookup raises anything else propagates to the
+            # caller, which logs it and falls back to the cached list.
+            location = getattr(document, "location", "")
+            return {
+                "id": getattr(document, "id", "unknown"),
+                "title": getattr(document, "title", "Error Loading Document"),
+                "url": getattr(document, "url", ""),
+                "archived": location == "archive",
+                "saved_for_later": location == "later",
+                "read": False,
+                "state": "reading",
+            }
 
     def get_article(self, article_id: str) -> dict[str, Any] | None:  # noqa: PLR0912, PLR0915
         """Get full article content with enhanced debugging.
@@ -857,15 +871,8 @@ class ReadwiseClient:
                 "timeframe", "month"
             )
 
-            # Try to expand the timeframe
-            if current_timeframe == "day":
-                new_timeframe = "week"
-            elif current_timeframe == "week":
-                new_timeframe = "month"
-            elif current_timeframe == "month":
-                new_timeframe = "year"
-            else:
-                new_timeframe = current_timeframe  # Keep current timeframe
+            # Try to expand the timeframe, keeping it if already the longest
+            new_timeframe = _NEXT_TIMEFRAME.get(current_timeframe, current_timeframe)
 
             # Reload with new timeframe if different
             if new_timeframe != current_timeframe:
@@ -935,13 +942,11 @@ class ReadwiseClient:
 
             if feed_data:
                 # Count unread articles (first_opened_at is empty)
-                return len([a for a in feed_data if a.get("first_opened_at") == ""])
+                return sum(a.get("first_opened_at") == "" for a in feed_data)
 
             # If no cache, make a lightweight API call
             documents: list[Document] = self._api.get_documents(location="feed")
-            unread_count = len([doc for doc in documents if not doc.first_opened_at])
-
-            return unread_count
+            return sum(not doc.first_opened_at for doc in documents)
         except Exception as e:
             logger.error(f"Error getting feed count: {e}")
             return 0
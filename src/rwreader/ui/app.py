@@ -2,8 +2,10 @@
 
 import logging
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePath
-from typing import ClassVar, Final
+from typing import Any, ClassVar, Final
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -21,6 +23,9 @@ from .screens.save_improved import SaveImprovedScreen
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Threads available for concurrent Readwise API calls
+_API_WORKERS = 8
+
 
 class RWReader(App[None]):
     """A Textual app for Readwise Reader with single-window navigation."""
@@ -56,6 +61,17 @@ class RWReader(App[None]):
             else "textual-light"
         )
 
+        # Blocking Readwise API calls run here rather than in asyncio's
+        # default executor, which is shared with everything else
+        self.api_executor = ThreadPoolExecutor(
+            max_workers=_API_WORKERS, thread_name_prefix="rw-api"
+        )
+
+        # Formatted article markdown keyed by (article_id, read, reading_progress),
+        # shared by reader screens and kept in least recently used order;
+        # forget_markdown() drops an article once it is moved or deleted
+        self.markdown_cache: OrderedDict[tuple[str, Any, Any], str] = OrderedDict()
+
     async def on_ready(self) -> None:
         """Initialize the app and push the initial screen."""
         # Create API client
@@ -63,14 +79,8 @@ class RWReader(App[None]):
             token=self.configuration.token
         )
 
-        # Load initial data into cache (non-blocking)
-        try:
-            # Pre-fetch inbox data to populate cache
-            self.client.get_inbox(refresh=True, limit=20)
-        except Exception as e:
-            logger.error(f"Error pre-fetching inbox: {e}")
-
-        # Push the category list screen as the initial screen
+        # Push the category list screen as the initial screen; it fetches
+        # all category counts in a background worker
         from .screens.category_list import CategoryListScreen  # noqa: PLC0415
 
         self.push_screen(CategoryListScreen())
@@ -89,12 +99,26 @@ class RWReader(App[None]):
 
     def action_toggle_help(self) -> None:
         """Show or hide the help screen."""
-        if hasattr(self.screen, "id") and self.screen.id == "help":
+        if isinstance(self.screen, HelpScreen):
             self.pop_screen()
         else:
-            self.push_screen(screen=HelpScreen())
+            # The registered "help" screen is built once and reused
+            self.push_screen(screen="help")
+
+    def forget_markdown(self, article_id: str) -> None:
+        """Drop every cached rendering of an article.
+
+        The formatted markdown includes the article's category, so entries
+        go stale once the article is moved or deleted.
+
+        Args:
+            article_id: ID of the article to drop
+        """
+        for key in [key for key in self.markdown_cache if key[0] == article_id]:
+            del self.markdown_cache[key]
 
     def on_unmount(self) -> None:
         """Clean up resources when the app is closed."""
         if hasattr(self, "client"):
             self.client.close()
+        self.api_executor.shutdown(wait=False, cancel_futures=True)
@@ -1,26 +1,70 @@
 """Article list screen for a category."""
 
+import asyncio
 import logging
-import webbrowser
-from typing import TYPE_CHECKING, Any, ClassVar
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, ListItem, ListView, Static
 
 from ...utils.ui_helpers import (
+    is_article_read,
     move_article_to_destination,
     safe_get_article_display_title,
-    safe_set_text_style,
 )
 
 if TYPE_CHECKING:
-    pass
+    from ..app import RWReader
+    from .article_reader import ArticleReaderScreen
+    from .confirm import DeleteArticleScreen
 
 logger = logging.getLogger(__name__)
 
+# Client methods fetching each category, and their retry polling variants
+_FETCHERS = {
+    "inbox": "get_inbox",
+    "feed": "get_feed",
+    "later": "get_later",
+    "archive": "get_archive",
+}
+_RETRY_FETCHERS = {
+    "inbox": "get_inbox_with_retry",
+    "feed": "get_feed_with_retry",
+    "later": "get_later_with_retry",
+}
+
+# Seconds the cursor must rest on an article before it is prefetched
+_PREFETCH_DELAY = 0.3
+# Seconds between frames of the refreshing title animation
+_REFRESH_ANIMATION_INTERVAL = 0.3
+# Long lists are mounted in chunks of rows as the cursor approaches their end
+_ROW_CHUNK_SIZE = 50
+_ROW_PRELOAD_MARGIN = 10
+# Fraction of the list the cursor must pass before more articles are loaded
+_LOAD_MORE_THRESHOLD = 0.8
+# Maximum number of formatted article titles kept per screen
+_TITLE_CACHE_SIZE = 5000
+
+
+# The screens pushed from the list are imported on first use and then reused
+@cache
+def _reader_screen_class() -> type["ArticleReaderScreen"]:
+    from .article_reader import ArticleReaderScreen  # noqa: PLC0415
+
+    return ArticleReaderScreen
+
+
+@cache
+def _delete_screen_class() -> type["DeleteArticleScreen"]:
+    from .confirm import DeleteArticleScreen  # noqa: PLC0415
+
+    return DeleteArticleScreen
+
 
 class ArticleListScreen(Screen):
     """Screen showing articles in a category."""
@@ -42,80 +86,130 @@ class ArticleListScreen(Screen):
         Binding("space", "load_more", "Load more"),
     ]
 
-    def __init__(self, category: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        category: str,
+        articles: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the article list screen.
 
         Args:
             category: Category name (inbox, later, feed, archive)
+            articles: Articles the caller already fetched for the category, shown
+                instead of fetching them again (default: None)
             **kwargs: Additional keyword arguments
         """
         super().__init__(**kwargs)
         self.category = category
+        self._initial_articles = articles
         self.articles: list[dict[str, Any]] = []
         self.current_index = 0
         self.initial_page_size = 20
         self.is_refreshing = False
         self.refresh_animation_step = 0
+        self._refresh_timer: Timer | None = None
+        # Article IDs already fetched into the client's article cache
+        self._prefetched: set[str] = set()
+        self._prefetch_timer: Timer | None = None
+        # Mounted rows; row i shows self.articles[i]
+        self._rows: list[ListItem] = []
+        # Formatted display titles by article ID
+        self._title_cache: dict[str, str] = {}
+        # Set while a load_more request is in flight
+        self._loading_more = False
+        # Set once every article in the category has been loaded
+        self._exhausted = False
+        # Fingerprint of the articles as last shown, see _articles_fingerprint
+        self._fingerprint = 0
+        # Set when the reader was dismissed with the current article list
+        self._reader_returned_list = False
 
     def compose(self) -> ComposeResult:
         """Create the article list UI."""
         yield Header(show_clock=True)
-        yield Static(f"{self.category.upper()}", id="category_title")
-        yield ListView(id="article_list")
+        self._title_widget = Static(f"{self.category.upper()}", id="category_title")
+        yield self._title_widget
+        self._list_view = ListView(id="article_list")
+        yield self._list_view
         yield Footer()
 
     async def on_mount(self) -> None:
         """Load articles when screen mounts."""
-        self.load_articles()
+        if self._initial_articles is None:
+            self.load_articles()
+            return
+        articles, self._initial_articles = self._initial_articles, None
+        self.articles = articles[: self.initial_page_size]
+        self._exhausted = len(articles) <= self.initial_page_size
+        self.populate_list()
+        self.notify(
+            f"Loaded {len(self.articles)} articles", title=self.category.capitalize()
+        )
 
     async def on_resume(self) -> None:
         """Refresh articles when screen resumes (e.g., after returning from reader)."""
-        logger.debug(f"ArticleListScreen resumed, refreshing {self.category} articles")
-        logger.debug(f"Current articles count: {len(self.articles)}")
+        logger.debug(
+            "ArticleListScreen resumed with %d %s articles",
+            len(self.articles),
+            self.category,
+        )
+        # The reader hands back its up-to-date list; no need to refetch it
+        if self._reader_returned_list:
+            self._reader_returned_list = False
+            return
         # Clear cache and trigger a background refresh to sync with server
-        if hasattr(self.app, "client"):
-            self.app.client.clear_cache()  # type: ignore
-        self.load_articles(load_more=False, from_refresh=False, use_retry=False)
+        self._prefetched.clear()
+        self.load_articles(
+            load_more=False, from_refresh=False, use_retry=False, clear_cache_first=True
+        )
 
     def on_show(self) -> None:
         """Called when screen becomes visible."""
-        logger.debug(f"ArticleListScreen shown, refreshing {self.category} articles")
+        logger.debug("ArticleListScreen shown, refreshing %s articles", self.category)
         # on_show is called before on_resume, so we don't need to reload here
-        # Just repopulate with current data
-        if len(self.articles) > 0:
+        # Just repopulate with current data. Before the first load has been
+        # shown there is nothing to update; the loading worker fills the list
+        if self._rows:
+            self._maybe_repopulate()
+
+    def _articles_fingerprint(self) -> int:
+        """Return a hash of the article IDs and read state shown in the list."""
+        return hash(
+            tuple((a.get("id"), a.get("read"), a.get("state")) for a in self.articles)
+        )
+
+    def _maybe_repopulate(self) -> None:
+        """Repopulate the list only if the articles changed since it was last shown."""
+        if self._articles_fingerprint() != self._fingerprint:
             self.populate_list()
 
     def _update_refresh_animation(self) -> None:
         """Update the title with refresh animation."""
-        if not self.is_refreshing:
-            return
-
         # Create animated dots
         dots = "." * (self.refresh_animation_step % 4)
-        title_text = f"{self.category.upper()} - Refreshing{dots}"
-
-        # Update the title
-        title = self.query_one("#category_title", Static)
-        title.update(title_text)
+        self._title_widget.update(f"{self.category.upper()} - Refreshing{dots}")
 
         # Increment animation step
         self.refresh_animation_step += 1
 
-        # Schedule next animation frame
-        if self.is_refreshing:
-            self.set_timer(0.3, self._update_refresh_animation)
-
     def _start_refresh_animation(self) -> None:
         """Start the refresh animation."""
         self.is_refreshing = True
         self.refresh_animation_step = 0
         self._update_refresh_animation()
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_interval(
+                _REFRESH_ANIMATION_INTERVAL, self._update_refresh_animation
+            )
 
     def _stop_refresh_animation(self) -> None:
         """Stop the refresh animation and restore title."""
         self.is_refreshing = False
-        title = self.query_one("#category_title", Static)
-        title.update(f"{self.category.upper()}")
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+        self._title_widget.update(f"{self.category.upper()}")
 
     @work(exclusive=False, thread=True)
     async def load_articles(  # noqa: PLR0912
@@ -123,6 +217,7 @@ class ArticleListScreen(Screen):
         load_more: bool = False,
         from_refresh: bool = False,
         use_retry: bool = False,
+        clear_cache_first: bool = False,
     ) -> None:
         """Load articles from API.
 
@@ -130,81 +225,59 @@ class ArticleListScreen(Screen):
             load_more: If True, load more articles beyond initial page
             from_refresh: If True, this is a user-initiated refresh
             use_retry: If True, use retry polling to handle server-side caching
+            clear_cache_first: If True, clear the client's cache before fetching
         """
         # Start refresh animation if this is a refresh action (must be called from main thread)
         if from_refresh:
             self.app.call_from_thread(self._start_refresh_animation)
 
-        if not hasattr(self.app, "client"):
-            logger.error("No client available")
-            self.app.call_from_thread(
-                self.notify, "API client not initialized", severity="error"
-            )
-            if from_refresh:
-                self.app.call_from_thread(self._stop_refresh_animation)
-            return
-
         try:
-            # Show loading message
-            if not load_more:
+            # Inside the try so the finally below still clears _loading_more
+            if not hasattr(self.app, "client"):
+                logger.error("No client available")
                 self.app.call_from_thread(
-                    self.notify, f"Loading {self.category} articles...", title="Loading"
+                    self.notify, "API client not initialized", severity="error"
                 )
+                return
 
             client = self.app.client  # type: ignore
+            if clear_cache_first:
+                client.clear_cache()
 
             # Get articles for the selected category
             # Use retry polling when requested to handle server-side caching
             # These calls are synchronous but run in worker thread thanks to @work(thread=True)
             limit = self.initial_page_size if not load_more else None
+            previous_ids = [article.get("id") for article in self.articles]
 
-            if use_retry and not load_more:
+            fetch_kwargs: dict[str, Any] = {"limit": limit}
+            if self.category == "feed":
+                # Only show unread articles in feed
+                fetch_kwargs["filter_unread"] = True
+            if use_retry and not load_more and self.category in _RETRY_FETCHERS:
                 # Use retry polling to get accurate counts after moves
                 logger.info(f"Using retry polling to fetch {self.category} articles")
-                if self.category == "inbox":
-                    self.articles = client.get_inbox_with_retry(limit=limit)
-                elif self.category == "feed":
-                    all_feed = client.get_feed_with_retry(limit=limit)
-                    self.articles = [
-                        article
-                        for article in all_feed
-                        if article.get("first_opened_at") == ""
-                    ]
-                elif self.category == "later":
-                    self.articles = client.get_later_with_retry(limit=limit)
-                elif self.category == "archive":
-                    # Archive doesn't have a retry method yet, use regular
-                    self.articles = client.get_archive(refresh=True, limit=limit)
-            # Use regular fetch
-            elif self.category == "inbox":
-                self.articles = client.get_inbox(
-                    refresh=not load_more,
-                    limit=limit,
-                )
-            elif self.category == "feed":
-                # Only show unread articles in feed
-                all_feed = client.get_feed(
-                    refresh=not load_more,
-                    limit=limit,
-                )
-                self.articles = [
-                    article
-                    for article in all_feed
-                    if article.get("first_opened_at") == ""
-                ]
-            elif self.category == "later":
-                self.articles = client.get_later(
-                    refresh=not load_more,
-                    limit=limit,
-                )
-            elif self.category == "archive":
-                self.articles = client.get_archive(
-                    refresh=not load_more,
-                    limit=limit,
-                )
-
-            # Populate the list (must be called from main thread)
-            self.app.call_from_thread(self.populate_list)
+                fetcher = _RETRY_FETCHERS[self.category]
+            else:
+                # Archive doesn't have a retry method yet, use regular
+                fetcher = _FETCHERS[self.category]
+                fetch_kwargs["refresh"] = not load_more
+            self.articles = getattr(client, fetcher)(**fetch_kwargs)
+
+            # Loading more fetches the rest of the category in one go
+            self._exhausted = load_more or len(self.articles) < self.initial_page_size
+
+            # Populate the list (must be called from main thread). When loading
+            # more keeps the existing rows in place, only the new tail is added
+            start = len(previous_ids)
+            if (
+                load_more
+                and start
+                and [a.get("id") for a in self.articles[:start]] == previous_ids
+            ):
+                self.app.call_from_thread(self._extend_list, start)
+            else:
+                self.app.call_from_thread(self.populate_list)
 
             if not load_more:
                 self.app.call_from_thread(
@@ -219,79 +292,242 @@ class ArticleListScreen(Screen):
                 self.notify, f"Error loading articles: {e}", severity="error"
             )
         finally:
+            if load_more:
+                self._loading_more = False
             # Stop refresh animation (must be called from main thread)
             if from_refresh:
                 self.app.call_from_thread(self._stop_refresh_animation)
 
-    def _verify_articles(self) -> None:
-        """Background verification of article list after initial load."""
-        logger.debug(f"Running background verification of {self.category} articles")
-        # Load again to check if list has changed (server-side cache may have cleared)
-        self.load_articles(load_more=False, from_refresh=False, use_retry=False)
+    def _display_title(self, article: dict[str, Any]) -> str:
+        """Return the display title for an article, formatting it only once.
 
-    def populate_list(self) -> None:
-        """Populate ListView with articles."""
-        logger.debug(f"populate_list called with {len(self.articles)} articles")
-        list_view = self.query_one("#article_list", ListView)
+        Args:
+            article: The article data dictionary
 
-        # Remove all existing items explicitly to avoid duplicate IDs
-        for child in list(list_view.children):
-            child.remove()
+        Returns:
+            Display title including the site name
+        """
+        article_id = str(article.get("id"))
+        display_title = self._title_cache.get(article_id)
+        if display_title is None:
+            if len(self._title_cache) >= _TITLE_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._title_cache[next(iter(self._title_cache))]
+            display_title = safe_get_article_display_title(article=article)
+            self._title_cache[article_id] = display_title
+        return display_title
 
-        list_view.clear()
+    def _build_list_item(self, article: dict[str, Any]) -> ListItem:
+        """Build the list row for an article.
 
-        for article in self.articles:
-            display_title = safe_get_article_display_title(article=article)
-            logger.debug(f"Adding article to list: {display_title[:50]}")
+        Args:
+            article: The article data dictionary
+
+        Returns:
+            ListItem carrying the article ID in its data
+        """
+        display_title = self._display_title(article)
+
+        # Don't set explicit IDs to avoid duplicate ID issues; Textual auto-generates
+        # them. Read status is styled through the read/unread classes in styles.tcss
+        list_item = ListItem(
+            Static(display_title, markup=False),
+            classes="read" if is_article_read(article) else "unread",
+        )
+        # Store article ID in data for reference
+        list_item.data = {"article_id": str(article.get("id"))}  # type: ignore
+        return list_item
+
+    def populate_list(self) -> None:
+        """Populate ListView with articles."""
+        logger.debug("populate_list called with %d articles", len(self.articles))
+        list_view = self._list_view
+        self._fingerprint = self._articles_fingerprint()
 
-            # Create list item - Don't set explicit ID to avoid duplicate ID issues
-            # Let Textual auto-generate IDs
-            list_item = ListItem(Static(display_title, markup=False))
-            # Store article ID in data for reference
-            list_item.data = {"article_id": str(article.get("id"))}  # type: ignore
+        # Most updates only drop or restyle articles; patch those rows in place
+        if self._update_rows_in_place(list_view):
+            return
 
-            # Style based on read status
-            is_read = article.get("read", False) or article.get("state") == "finished"
-            safe_set_text_style(item=list_item, style="none" if is_read else "bold")
+        # Rebuild the rows in a single screen update
+        with self.app.batch_update():
+            # Rows carry no explicit IDs, so clearing can't leave duplicates behind
+            list_view.clear()
 
-            list_view.append(list_item)
+            # Mount the first window of rows; the rest is mounted on demand
+            self._rows = [
+                self._build_list_item(article)
+                for article in self.articles[:_ROW_CHUNK_SIZE]
+            ]
+            list_view.extend(self._rows)
 
         # Focus the list and select first item
         list_view.focus()
-        if len(list_view.children) > 0:
+        if self._rows and list_view.index != 0:
             list_view.index = 0
 
+    def _update_rows_in_place(self, list_view: ListView) -> bool:
+        """Apply self.articles to the mounted rows without rebuilding them.
+
+        Rows whose article is gone are removed and the rest are restyled.
+        This only works when the remaining rows are still the head of the
+        article list, in the same order.
+
+        Args:
+            list_view: The article ListView
+
+        Returns:
+            True if the rows were updated, False if a full rebuild is needed
+        """
+        new_ids = [str(article.get("id")) for article in self.articles]
+        wanted = set(new_ids)
+        row_ids: list[str] = [row.data["article_id"] for row in self._rows]  # type: ignore
+        kept_ids = [row_id for row_id in row_ids if row_id in wanted]
+        if not kept_ids or kept_ids != new_ids[: len(kept_ids)]:
+            return False
+
+        with self.app.batch_update():
+            if len(kept_ids) < len(row_ids):
+                self._remove_rows(
+                    list_view,
+                    [
+                        row
+                        for row, row_id in zip(self._rows, row_ids, strict=True)
+                        if row_id not in wanted
+                    ],
+                )
+                self._rows = [
+                    row
+                    for row, row_id in zip(self._rows, row_ids, strict=True)
+                    if row_id in wanted
+                ]
+            self._restyle_rows()
+            if len(self._rows) < _ROW_CHUNK_SIZE:
+                self._mount_next_chunk()
+        return True
+
+    @staticmethod
+    def _remove_rows(list_view: ListView, rows: list[ListItem]) -> None:
+        """Remove rows from the ListView, keeping the highlighted index valid.
+
+        Args:
+            list_view: The article ListView
+            rows: Rows to remove
+        """
+        # Resolve positions against the ListView itself; rows removed earlier
+        # may still be attached while Textual prunes them
+        positions = {row: index for index, row in enumerate(list_view.query(ListItem))}
+        list_view.remove_items([positions[row] for row in rows if row in positions])
+
+    def _mount_next_chunk(self) -> None:
+        """Mount rows for the next chunk of articles that have none yet."""
+        start = len(self._rows)
+        if start >= len(self.articles):
+            return
+        rows = [
+            self._build_list_item(article)
+            for article in self.articles[start : start + _ROW_CHUNK_SIZE]
+        ]
+        self._rows.extend(rows)
+        self._list_view.extend(rows)
+
+    def _extend_list(self, start: int) -> None:
+        """Continue the list after the articles from start onwards were added.
+
+        Args:
+            start: Index of the first article without a row
+        """
+        if len(self._rows) > start:
+            self.populate_list()
+            return
+        # Rows for the new articles are mounted as the cursor approaches them
+        self._fingerprint = self._articles_fingerprint()
+        if len(self._rows) == start:
+            self._mount_next_chunk()
+
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        list_view = self.query_one(ListView)
-        list_view.action_cursor_down()
+        self._list_view.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        list_view = self.query_one(ListView)
-        list_view.action_cursor_up()
+        self._list_view.action_cursor_up()
 
     def _on_reader_dismissed(self, result: dict | None) -> None:
         """Handle result from ArticleReaderScreen dismiss, updating article list immediately."""
         if result and "articles" in result:
+            # Runs before on_resume, which can then skip its network reload
+            self._reader_returned_list = True
+            # Nothing to update if the reader changed neither the list nor its entries
+            if result.get("revision") == 0:
+                return
+            # Rows still present are restyled in place, removed ones dropped
             self.articles = result["articles"]
-            self.populate_list()
+            self._maybe_repopulate()
+
+    def _restyle_rows(self) -> None:
+        """Update the read/unread styling of the existing rows in place."""
+        for list_item, article in zip(self._rows, self.articles, strict=False):
+            is_read = is_article_read(article)
+            list_item.set_class(is_read, "read")
+            list_item.set_class(not is_read, "unread")
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Mount more rows near the end and prefetch the highlighted article."""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+
+        index = event.list_view.index
+        if index is None or not 0 <= index < len(self.articles):
+            return
+        if index >= len(self._rows) - _ROW_PRELOAD_MARGIN:
+            self._mount_next_chunk()
+        if index >= int(_LOAD_MORE_THRESHOLD * len(self.articles)):
+            self._load_more_in_background()
+        article_id = str(self.articles[index].get("id"))
+        if article_id in self._prefetched:
+            return
+        self._prefetch_timer = self.set_timer(
+            _PREFETCH_DELAY, partial(self._start_prefetch, article_id)
+        )
+
+    def _start_prefetch(self, article_id: str) -> None:
+        """Mark an article as prefetched and fetch it in the background.
+
+        Args:
+            article_id: ID of the article to fetch
+        """
+        self._prefetch_timer = None
+        if article_id in self._prefetched or not hasattr(self.app, "client"):
+            return
+        self._prefetched.add(article_id)
+        self.prefetch_article(article_id)
+
+    @work(thread=True, group="prefetch")
+    def prefetch_article(self, article_id: str) -> None:
+        """Fetch an article into the client cache so opening it is instant.
+
+        Args:
+            article_id: ID of the article to fetch
+        """
+        try:
+            self.app.client.get_article(article_id=article_id)  # type: ignore
+        except Exception as e:
+            logger.debug(f"Prefetch of article {article_id} failed: {e}")
+            self._prefetched.discard(article_id)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle ListView item selection (Enter key)."""
         # Get the index of the selected item
-        list_view = self.query_one(ListView)
+        list_view = self._list_view
         if list_view.index is not None:
             self.current_index = list_view.index
             if 0 <= self.current_index < len(self.articles):
                 article = self.articles[self.current_index]
 
-                # Import ArticleReaderScreen
-                from .article_reader import ArticleReaderScreen  # noqa: PLC0415
-
                 # Pass a copy of article_list to avoid mutable shared state
                 self.app.push_screen(
-                    ArticleReaderScreen(
+                    _reader_screen_class()(
                         article=article,
                         article_list=list(self.articles),
                         current_index=self.current_index,
@@ -302,19 +538,16 @@ class ArticleListScreen(Screen):
 
     async def action_select_article(self) -> None:
         """Select article and push reader screen (fallback)."""
-        list_view = self.query_one(ListView)
+        list_view = self._list_view
         if list_view.highlighted_child and list_view.index is not None:
             # Get highlighted index
             self.current_index = list_view.index
             if 0 <= self.current_index < len(self.articles):
                 article = self.articles[self.current_index]
 
-                # Import ArticleReaderScreen
-                from .article_reader import ArticleReaderScreen  # noqa: PLC0415
-
                 # Pass a copy of article_list to avoid mutable shared state
                 self.app.push_screen(
-                    ArticleReaderScreen(
+                    _reader_screen_class()(
                         article=article,
                         article_list=list(self.articles),
                         current_index=self.current_index,
@@ -335,22 +568,31 @@ class ArticleListScreen(Screen):
         """Move article to Inbox."""
         await self._move_article("inbox")
 
-    async def _move_article(self, destination: str) -> None:
-        """Move the highlighted article to a destination.
+    def _current_article(self) -> dict[str, Any] | None:
+        """Return the highlighted article, warning if nothing is selected.
 
-        Args:
-            destination: Target location (inbox, later, archive)
+        Returns:
+            The highlighted article, or None if there is none
         """
-        list_view = self.query_one(ListView)
+        list_view = self._list_view
         if not list_view.highlighted_child or list_view.index is None:
             self.notify("No article selected", severity="warning")
-            return
+            return None
 
         index = list_view.index
         if not (0 <= index < len(self.articles)):
-            return
+            return None
+        return self.articles[index]
 
-        article = self.articles[index]
+    async def _move_article(self, destination: str) -> None:
+        """Move the highlighted article to a destination.
+
+        Args:
+            destination: Target location (inbox, later, archive)
+        """
+        article = self._current_article()
+        if article is None:
+            return
         article_id = str(article.get("id"))
 
         if not hasattr(self.app, "client"):
@@ -358,39 +600,60 @@ class ArticleListScreen(Screen):
             return
 
         client = self.app.client  # type: ignore
-        success, message = move_article_to_destination(
-            client=client, article_id=article_id, destination=destination
+        # Run the blocking API call off the event loop
+        success, message = await asyncio.get_running_loop().run_in_executor(
+            self.app.api_executor,  # type: ignore
+            partial(
+                move_article_to_destination,
+                client=client,
+                article_id=article_id,
+                destination=destination,
+            ),
         )
 
         if success:
             self.notify(message, title="Success")
+            # Cached renderings still show the old category
+            cast("RWReader", self.app).forget_markdown(article_id)
             if self.category != destination:
-                self.articles.pop(index)
-                self.populate_list()
+                self._drop_article(article_id)
         else:
             self.notify(message, severity="error")
 
+    def _drop_article(self, article_id: str) -> None:
+        """Remove an article from the list after it was moved or deleted.
+
+        The list may have been reloaded while the API call was running, so
+        the article is looked up by ID rather than by its old index.
+
+        Args:
+            article_id: ID of the article to remove
+        """
+        for index, article in enumerate(self.articles):
+            if str(article.get("id")) == article_id:
+                self.articles.pop(index)
+                self._title_cache.pop(article_id, None)
+                # Remove just this row rather than rebuilding the list
+                if index < len(self._rows):
+                    self._remove_rows(
+                        self._list_view,
+                        [self._rows.pop(index)],
+                    )
+                self._fingerprint = self._articles_fingerprint()
+                return
+
     @work
     async def action_delete_article(self) -> None:
         """Delete article (with confirmation)."""
-        list_view = self.query_one(ListView)
-        if not list_view.highlighted_child or list_view.index is None:
-            self.notify("No article selected", severity="warning")
+        article = self._current_article()
+        if article is None:
             return
-
-        index = list_view.index
-        if not (0 <= index < len(self.articles)):
-            return
-
-        article = self.articles[index]
         article_id = str(article.get("id"))
         article_title = article.get("title", "Unknown article")
 
         # Push confirmation dialog
-        from .confirm import DeleteArticleScreen  # noqa: PLC0415
-
         result = await self.app.push_screen_wait(
-            DeleteArticleScreen(article_id=article_id, article_title=article_title)
+            _delete_screen_class()(article_id=article_id, article_title=article_title)
         )
 
         # Check if confirmed
@@ -398,31 +661,28 @@ class ArticleListScreen(Screen):
             try:
                 if hasattr(self.app, "client"):
                     client = self.app.client  # type: ignore
-                    client.delete_article(article_id=article_id)
+                    await asyncio.get_running_loop().run_in_executor(
+                        self.app.api_executor,  # type: ignore
+                        partial(client.delete_article, article_id=article_id),
+                    )
                     self.notify("Article deleted", title="Success")
-                    # Remove from list
-                    self.articles.pop(index)
-                    self.populate_list()
+                    cast("RWReader", self.app).forget_markdown(article_id)
+                    self._drop_article(article_id)
             except Exception as e:
                 logger.error(f"Error deleting article: {e}")
                 self.notify(f"Error: {e}", severity="error")
 
     async def action_open_browser(self) -> None:
         """Open the highlighted article in browser."""
-        list_view = self.query_one(ListView)
-        if not list_view.highlighted_child or list_view.index is None:
-            self.notify("No article selected", severity="warning")
-            return
-
-        index = list_view.index
-        if not (0 <= index < len(self.articles)):
+        article = self._current_article()
+        if article is None:
             return
-
-        article = self.articles[index]
         url = article.get("url")
 
         if url:
             try:
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url)
                 self.notify("Opening in browser", title="Browser")
             except Exception as e:
@@ -433,20 +693,15 @@ class ArticleListScreen(Screen):
 
     async def action_open_source_browser(self) -> None:
         """Open the original source URL of the highlighted article in browser."""
-        list_view = self.query_one(ListView)
-        if not list_view.highlighted_child or list_view.index is None:
-            self.notify("No article selected", severity="warning")
+        article = self._current_article()
+        if article is None:
             return
-
-        index = list_view.index
-        if not (0 <= index < len(self.articles)):
-            return
-
-        article = self.articles[index]
         url = article.get("source_url")
 
         if url:
             try:
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url)
                 self.notify("Opening source URL in browser", title="Browser")
             except Exception as e:
@@ -457,12 +712,20 @@ class ArticleListScreen(Screen):
 
     def action_refresh(self) -> None:
         """Refresh articles."""
-        if hasattr(self.app, "client"):
-            self.app.client.clear_cache()  # type: ignore
-        self.load_articles(load_more=False, from_refresh=True)
+        self._prefetched.clear()
+        self.load_articles(load_more=False, from_refresh=True, clear_cache_first=True)
+
+    def _load_more_in_background(self) -> None:
+        """Load the rest of the category before the cursor reaches the end."""
+        if self._loading_more or self._exhausted or self.is_refreshing:
+            return
+        self.action_load_more()
 
     def action_load_more(self) -> None:
         """Load more articles."""
+        if self._loading_more:
+            return
+        self._loading_more = True
         self.load_articles(load_more=True)
 
     def action_back(self) -> None:
@@ -471,6 +734,5 @@ class ArticleListScreen(Screen):
 
     def action_help(self) -> None:
         """Show help screen."""
-        from .help import HelpScreen  # noqa: PLC0415
-
-        self.app.push_screen(HelpScreen())
+        # The app's registered "help" screen is built once and reused
+        self.app.push_screen("help")
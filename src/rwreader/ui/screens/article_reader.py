@@ -3,15 +3,17 @@
 import asyncio
 import logging
 import re
-import webbrowser
-from typing import TYPE_CHECKING, Any, ClassVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 
+from ...exceptions import RWReaderError
 from ...utils.highlight_manager import (
     create_reader_highlight,
     find_html_fragment,
@@ -19,14 +21,39 @@ from ...utils.highlight_manager import (
     inject_highlights_into_markdown,
     is_readwise_cli_available,
 )
-from ...utils.ui_helpers import format_article_content, move_article_to_destination
+from ...utils.ui_helpers import (
+    format_article_content,
+    format_article_header,
+    move_article_to_destination,
+)
 from ..widgets.linkable_markdown_viewer import LinkableMarkdownViewer
 
 if TYPE_CHECKING:
-    pass
+    from ..app import RWReader
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after the last cursor move before re-rendering the article
+_CURSOR_RENDER_DELAY = 0.05
+# Number of formatted articles kept for navigating back and forth
+_MARKDOWN_CACHE_SIZE = 64
+# Seconds to wait for a neighbouring article to be fetched and formatted
+_PREFETCH_TIMEOUT = 10
+# Seconds an article may take to load before the loading placeholder is shown
+_LOADING_PLACEHOLDER_DELAY = 0.15
+# Articles with less content than this are formatted on the event loop,
+# where it is quicker than a round trip through the executor
+_INLINE_FORMAT_MAX_CHARS = 16_384
+# Articles longer than this are shown in two steps: the first _STREAM_HEAD_CHARS
+# are painted right away and the rest is appended after the next refresh
+_STREAM_MIN_CHARS = 32_768
+_STREAM_HEAD_CHARS = 16_384
+# Maximum number of neighbouring articles fetched at the same time
+_PREFETCH_CONCURRENCY = 2
+# Markdown links, [text](url), and the blank lines separating paragraphs
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\n+")
+
 
 class ArticleReaderScreen(Screen):
     """Screen for reading a single article."""
@@ -70,24 +97,39 @@ class ArticleReaderScreen(Screen):
         super().__init__(**kwargs)
         self.article = article
         self.article_list = article_list
+        # Bumped whenever article_list or one of its entries changes, so the
+        # article list can skip its update when nothing did
+        self.revision = 0
         self.current_index = current_index
         self.category = category
         self.content_markdown = ""
+        # Links in content_markdown, extracted on first use
+        self._links: list[tuple[str, str]] | None = None
         self.highlights: list[dict[str, Any]] = []
         self._paragraphs: list[str] = []
+        # Character offset of each paragraph in content_markdown (-1 if not found)
+        self._paragraph_offsets: list[int] = []
         self._cursor: int = -1
+        self._cursor_render_timer: Timer | None = None
+        self._placeholder_timer: Timer | None = None
+        self._prefetch_slots = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
         self.is_loading = False
+        # Set when the article changed while another one was loading
+        self._reload_pending = False
 
     def compose(self) -> ComposeResult:
         """Create the article reader UI."""
-        yield Header(show_clock=True)
-        yield Static("", id="article_position")
-        yield LinkableMarkdownViewer(
+        # Keep references to the widgets updated on every render
+        self._position_widget = Static("", id="article_position")
+        self._content_view = LinkableMarkdownViewer(
             markdown="# Loading...\n\nPlease wait...",
             id="article_content",
             show_table_of_contents=False,
             open_links=False,
         )
+        yield Header(show_clock=True)
+        yield self._position_widget
+        yield self._content_view
         yield Footer()
 
     async def on_mount(self) -> None:
@@ -101,32 +143,39 @@ class ArticleReaderScreen(Screen):
             return
 
         self.is_loading = True
+        # Drop any pending cursor render for the previous article
+        if self._cursor_render_timer is not None:
+            self._cursor_render_timer.stop()
+            self._cursor_render_timer = None
 
         try:
             # Update position indicator
             position_text = f"Article {self.current_index + 1} of {len(self.article_list)} in {self.category.capitalize()}"
-            position_widget = self.query_one("#article_position", Static)
-            position_widget.update(position_text)
+            self._position_widget.update(position_text)
 
             # Get full article from API
             if not hasattr(self.app, "client"):
                 self.notify("API client not available", severity="error")
                 return
 
-            client = self.app.client  # type: ignore
+            app = cast("RWReader", self.app)
+            client = app.client
             article_id = str(self.article.get("id"))
 
-            # Show loading status
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
-            content_view.update_content("# Loading article...\n\nPlease wait...")
+            # Show the header from list metadata only if the full article is
+            # slow to arrive; cached articles replace the old one directly
+            content_view = self._content_view
+            self._placeholder_timer = self.set_timer(
+                _LOADING_PLACEHOLDER_DELAY, self._show_loading_placeholder
+            )
 
             # Fetch article with timeout
             FETCH_TIMEOUT = 10
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             full_article = await asyncio.wait_for(
                 loop.run_in_executor(
-                    None,
-                    lambda: client.get_article(article_id=article_id),
+                    app.api_executor,
+                    partial(client.get_article, article_id=article_id),
                 ),
                 timeout=FETCH_TIMEOUT,
             )
@@ -135,47 +184,182 @@ class ArticleReaderScreen(Screen):
                 content_view.update_content("# Error\n\nArticle not found.")
                 return
 
-            # Update article with full content
-            self.article = full_article
-
-            # Format content
-            self.content_markdown = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: format_article_content(article=full_article),
-                ),
-                timeout=FETCH_TIMEOUT,
+            # Format content, reusing the result when revisiting an article
+            content_markdown = await self._format_article(
+                full_article, timeout=FETCH_TIMEOUT
             )
+            if self._reload_pending:
+                # The user moved to another article while this one loaded
+                return
 
-            # Parse paragraphs and initialise cursor at the first one
-            self._paragraphs = self._parse_paragraphs(self.content_markdown)
-            self._cursor = 0 if self._paragraphs else -1
-
-            # Display content (without highlights initially)
-            self.highlights = []
-            content_view.update_content(self._get_display_markdown())
-            self._update_position_widget()
+            # Update article with full content
+            self.article = full_article
+            self._sync_read_status(full_article)
+            self.content_markdown = content_markdown
+            self._show_article()
 
             # Fetch highlights in background if CLI is available
             cli_available = is_readwise_cli_available()
             logger.debug(
-                f"Highlight CLI available: {cli_available}, article_id={article_id!r}"
+                "Highlight CLI available: %s, article_id=%r", cli_available, article_id
             )
             if cli_available:
                 self.fetch_highlights(article_id=article_id)
 
+            # Warm the caches for the articles J and K lead to
+            self._prefetch(self.current_index + 1)
+            self._prefetch(self.current_index - 1)
+
         except TimeoutError:
             logger.error("Timeout loading article")
-            self.notify("Timeout loading article", severity="error")
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
-            content_view.update_content("# Timeout\n\nFailed to load article in time.")
+            self._show_load_error(
+                "Timeout loading article",
+                "# Timeout\n\nFailed to load article in time.",
+            )
+        except (RWReaderError, ValueError, KeyError, OSError) as e:
+            logger.error("Error loading article: %s", e)
+            self._show_load_error(f"Error: {e}", f"# Error\n\n{e}")
         except Exception as e:
-            logger.error(f"Error loading article: {e}")
-            self.notify(f"Error: {e}", severity="error")
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
-            content_view.update_content(f"# Error\n\n{e}")
+            # Unexpected; keep the traceback so the bug isn't masked
+            logger.exception("Unexpected error loading article")
+            self._show_load_error(f"Error: {e}", f"# Error\n\n{e}")
         finally:
-            self.is_loading = False
+            self._finish_loading()
+
+    def _finish_loading(self) -> None:
+        """Clean up after a load and start the next one if navigation is pending."""
+        if self._placeholder_timer is not None:
+            self._placeholder_timer.stop()
+            self._placeholder_timer = None
+        self.is_loading = False
+        if self._reload_pending:
+            self._reload_pending = False
+            self.call_later(self.load_article_content)
+
+    def _show_article(self) -> None:
+        """Display the newly loaded content_markdown, without highlights."""
+        self._links = None
+
+        # Parse paragraphs and initialise cursor at the first one
+        self._paragraphs = self._parse_paragraphs(self.content_markdown)
+        self._paragraph_offsets = self._locate_paragraphs(
+            self.content_markdown, self._paragraphs
+        )
+        self._cursor = 0 if self._paragraphs else -1
+
+        # Display content (without highlights initially)
+        self.highlights = []
+        self._show_markdown(self._get_display_markdown())
+        self._update_position_widget()
+
+    def _show_loading_placeholder(self) -> None:
+        """Show the article header from list metadata while the article loads."""
+        self._placeholder_timer = None
+        self._content_view.update_content(
+            format_article_header(article=self.article) + "*Loading article...*"
+        )
+
+    def _show_load_error(self, message: str, markdown: str) -> None:
+        """Report a failed article load.
+
+        Args:
+            message: Notification text
+            markdown: Markdown shown in place of the article
+        """
+        self.notify(message, severity="error")
+        self._content_view.update_content(markdown)
+
+    def _show_markdown(self, markdown: str) -> None:
+        """Display newly loaded markdown, streaming very long articles.
+
+        Args:
+            markdown: Markdown to display
+        """
+        split = -1
+        if len(markdown) > _STREAM_MIN_CHARS:
+            split = markdown.rfind("\n\n", 0, _STREAM_HEAD_CHARS)
+        if split <= 0:
+            self._content_view.update_content(markdown)
+            return
+        head = markdown[:split]
+        self._content_view.update_content(head)
+        self._append_markdown(markdown[split:], after=head)
+
+    @work(exclusive=True, group="append")
+    async def _append_markdown(self, markdown: str, after: str) -> None:
+        """Append the rest of a streamed article once its head is shown.
+
+        Args:
+            markdown: Markdown to append
+            after: The head shown by the viewer
+        """
+        await self._content_view.append_content(markdown, after=after)
+
+    async def _format_article(self, article: dict[str, Any], timeout: float) -> str:
+        """Format an article to markdown, using the app's shared cache.
+
+        Args:
+            article: The full article to format
+            timeout: Seconds to wait for formatting to finish
+
+        Returns:
+            Formatted markdown content
+        """
+        cache_key = (
+            str(article.get("id")),
+            article.get("read"),
+            article.get("reading_progress"),
+        )
+        # Shared by all reader screens so revisits skip formatting
+        markdown_cache = cast("RWReader", self.app).markdown_cache
+        cached = markdown_cache.get(cache_key)
+        if cached is not None:
+            markdown_cache.move_to_end(cache_key)
+            return cached
+
+        size = len(article.get("html_content") or article.get("content") or "")
+        if size < _INLINE_FORMAT_MAX_CHARS:
+            content_markdown = format_article_content(article=article)
+        else:
+            loop = asyncio.get_running_loop()
+            content_markdown = await asyncio.wait_for(
+                loop.run_in_executor(
+                    None,
+                    partial(format_article_content, article=article),
+                ),
+                timeout=timeout,
+            )
+        markdown_cache[cache_key] = content_markdown
+        if len(markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            markdown_cache.popitem(last=False)
+        return content_markdown
+
+    @work(exclusive=False, group="prefetch")
+    async def _prefetch(self, index: int) -> None:
+        """Fetch and format a neighbouring article in the background.
+
+        Args:
+            index: Position of the article in article_list
+        """
+        if not 0 <= index < len(self.article_list) or not hasattr(self.app, "client"):
+            return
+        app = cast("RWReader", self.app)
+        client = app.client
+        article_id = str(self.article_list[index].get("id"))
+        async with self._prefetch_slots:
+            try:
+                loop = asyncio.get_running_loop()
+                full_article = await asyncio.wait_for(
+                    loop.run_in_executor(
+                        app.api_executor,
+                        partial(client.get_article, article_id=article_id),
+                    ),
+                    timeout=_PREFETCH_TIMEOUT,
+                )
+                if full_article:
+                    await self._format_article(full_article, timeout=_PREFETCH_TIMEOUT)
+            except Exception as e:
+                logger.debug("Prefetch of article %s failed: %s", article_id, e)
 
     @work(exclusive=True)
     async def fetch_highlights(self, article_id: str) -> None:
@@ -185,21 +369,23 @@ class ArticleReaderScreen(Screen):
             article_id: ID of the article being displayed; used to guard
                         against stale updates when the user navigates away.
         """
-        logger.debug(f"fetch_highlights started for article_id={article_id!r}")
+        logger.debug("fetch_highlights started for article_id=%r", article_id)
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             highlights = await loop.run_in_executor(
-                None,
-                lambda: get_highlights_for_document(article_id),
+                cast("RWReader", self.app).api_executor,
+                partial(get_highlights_for_document, article_id),
             )
             logger.debug(
-                f"fetch_highlights got {len(highlights)} highlights for {article_id!r}"
+                "fetch_highlights got %d highlights for %r", len(highlights), article_id
             )
 
             # Guard: article may have changed while we were fetching
             current_id = str(self.article.get("id"))
             logger.debug(
-                f"fetch_highlights guard: current_id={current_id!r} article_id={article_id!r}"
+                "fetch_highlights guard: current_id=%r article_id=%r",
+                current_id,
+                article_id,
             )
             if current_id != article_id:
                 logger.debug("fetch_highlights: article changed, discarding results")
@@ -210,7 +396,7 @@ class ArticleReaderScreen(Screen):
                 return
 
             self.highlights = highlights
-            logger.debug(f"fetch_highlights: {len(highlights)} highlights loaded")
+            logger.debug("fetch_highlights: %d highlights loaded", len(highlights))
             self._update_display()
             self.notify(
                 f"{len(highlights)} highlight(s) loaded",
@@ -218,15 +404,34 @@ class ArticleReaderScreen(Screen):
             )
 
         except Exception as e:
-            logger.error(f"Error fetching highlights: {e}", exc_info=True)
+            logger.error("Error fetching highlights: %s", e, exc_info=True)
 
     # ── Paragraph cursor helpers ──────────────────────────────────────────
 
+    def _sync_read_status(self, full_article: dict[str, Any]) -> None:
+        """Copy read state from a fetched article into the shared list entry.
+
+        The article list shares these dicts with the reader, so updating the
+        entry lets it restyle its rows without rebuilding them.
+
+        Args:
+            full_article: The freshly fetched article
+        """
+        if not 0 <= self.current_index < len(self.article_list):
+            return
+        entry = self.article_list[self.current_index]
+        if entry is full_article or entry.get("id") != full_article.get("id"):
+            return
+        for key in ("read", "state"):
+            if key in full_article and entry.get(key) != full_article[key]:
+                entry[key] = full_article[key]
+                self.revision += 1
+
     @staticmethod
     def _parse_paragraphs(markdown: str) -> list[str]:
         """Return highlightable paragraph strings from markdown."""
         _MIN_LEN = 30
-        blocks = re.split(r"\n\n+", markdown)
+        blocks = _PARAGRAPH_BREAK_RE.split(markdown)
         result = []
         for raw_block in blocks:
             stripped = raw_block.strip()
@@ -239,6 +444,22 @@ class ArticleReaderScreen(Screen):
             result.append(stripped)
         return result
 
+    @staticmethod
+    def _locate_paragraphs(markdown: str, paragraphs: list[str]) -> list[int]:
+        """Return the character offset of each paragraph within markdown.
+
+        Paragraphs are located in order, so repeated text maps to its own
+        occurrence rather than the first one.
+        """
+        offsets = []
+        pos = 0
+        for paragraph in paragraphs:
+            offset = markdown.find(paragraph, pos)
+            offsets.append(offset)
+            if offset != -1:
+                pos = offset + len(paragraph)
+        return offsets
+
     def _get_display_markdown(self) -> str:
         """Build display markdown: cursor mark first, then highlight markers."""
         base = self.content_markdown
@@ -246,9 +467,10 @@ class ArticleReaderScreen(Screen):
         # Mark cursor paragraph with a blockquote prefix (visual left-side marker)
         if 0 <= self._cursor < len(self._paragraphs):
             cursor_text = self._paragraphs[self._cursor]
-            if cursor_text in base:
+            start = self._paragraph_offsets[self._cursor]
+            if start != -1:
                 quoted = "\n".join(f"> {line}" for line in cursor_text.split("\n"))
-                base = base.replace(cursor_text, quoted, 1)
+                base = base[:start] + quoted + base[start + len(cursor_text) :]
 
         if self.highlights:
             base = inject_highlights_into_markdown(base, self.highlights)
@@ -257,11 +479,11 @@ class ArticleReaderScreen(Screen):
     def _update_display(self) -> None:
         """Refresh the content view and position widget."""
         try:
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
+            content_view = self._content_view
             content_view.update_content(self._get_display_markdown())
             self._update_position_widget()
         except Exception as e:
-            logger.debug(f"Error updating display: {e}")
+            logger.debug("Error updating display: %s", e)
 
     def _update_position_widget(self) -> None:
         """Update the position bar with article index and cursor position."""
@@ -275,7 +497,7 @@ class ArticleReaderScreen(Screen):
             text = f"{article_info}  |  {cursor_info}"
         else:
             text = article_info
-        position_widget = self.query_one("#article_position", Static)
+        position_widget = self._position_widget
         position_widget.update(text)
 
     def _scroll_to_cursor(self) -> None:
@@ -283,13 +505,12 @@ class ArticleReaderScreen(Screen):
         if not self._paragraphs or self._cursor < 0:
             return
         try:
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
+            content_view = self._content_view
             if self._cursor == 0:
                 content_view.scroll_home(animate=False)
                 return
 
-            cursor_text = self._paragraphs[self._cursor]
-            offset = self.content_markdown.find(cursor_text)
+            offset = self._paragraph_offsets[self._cursor]
             total = len(self.content_markdown)
             if offset < 0 or total == 0:
                 return
@@ -298,37 +519,52 @@ class ArticleReaderScreen(Screen):
             target = int(content_view.virtual_size.height * pct)
             content_view.scroll_to(y=target, animate=False)
         except Exception as e:
-            logger.debug(f"Error scrolling to cursor: {e}")
+            logger.debug("Error scrolling to cursor: %s", e)
 
     # ── Cursor actions ────────────────────────────────────────────────────
 
+    def _schedule_cursor_render(self) -> None:
+        """Update the position bar now and re-render once cursor keys pause."""
+        self._update_position_widget()
+        if self._cursor_render_timer is not None:
+            self._cursor_render_timer.stop()
+        self._cursor_render_timer = self.set_timer(
+            _CURSOR_RENDER_DELAY, self._render_cursor
+        )
+
+    def _render_cursor(self) -> None:
+        """Re-render the article with the cursor marker and scroll to it."""
+        self._cursor_render_timer = None
+        self._update_display()
+        self._scroll_to_cursor()
+
     def action_cursor_prev(self) -> None:
         """Move the highlight cursor to the previous paragraph."""
         if not self._paragraphs:
             return
-        self._cursor = max(0, self._cursor - 1)
-        self._update_display()
-        self._scroll_to_cursor()
+        cursor = max(0, self._cursor - 1)
+        if cursor == self._cursor:
+            return
+        self._cursor = cursor
+        self._schedule_cursor_render()
 
     def action_cursor_next(self) -> None:
         """Move the highlight cursor to the next paragraph."""
         if not self._paragraphs:
             return
-        self._cursor = min(len(self._paragraphs) - 1, self._cursor + 1)
-        self._update_display()
-        self._scroll_to_cursor()
+        cursor = min(len(self._paragraphs) - 1, self._cursor + 1)
+        if cursor == self._cursor:
+            return
+        self._cursor = cursor
+        self._schedule_cursor_render()
 
     def action_scroll_top(self) -> None:
         """Scroll to the top of the article."""
-        self.query_one("#article_content", LinkableMarkdownViewer).scroll_home(
-            animate=False
-        )
+        self._content_view.scroll_home(animate=False)
 
     def action_scroll_bottom(self) -> None:
         """Scroll to the bottom of the article."""
-        self.query_one("#article_content", LinkableMarkdownViewer).scroll_end(
-            animate=False
-        )
+        self._content_view.scroll_end(animate=False)
 
     # ── Highlight creation / deletion ─────────────────────────────────────
 
@@ -359,7 +595,7 @@ class ArticleReaderScreen(Screen):
         )
 
         article_id = str(self.article.get("id"))
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         if existing:
             self.notify(
@@ -370,11 +606,11 @@ class ArticleReaderScreen(Screen):
         html_content = self.article.get("html_content", "")
         html_frag = await loop.run_in_executor(
             None,
-            lambda: find_html_fragment(html_content, para_text),
+            partial(find_html_fragment, html_content, para_text),
         )
         success, msg = await loop.run_in_executor(
-            None,
-            lambda: create_reader_highlight(article_id, html_frag),
+            cast("RWReader", self.app).api_executor,
+            partial(create_reader_highlight, article_id, html_frag),
         )
         if success:
             self.notify("Highlight created", title="Highlights")
@@ -389,6 +625,7 @@ class ArticleReaderScreen(Screen):
             self.article = self.article_list[self.current_index]
             self.highlights = []
             self._paragraphs = []
+            self._paragraph_offsets = []
             self._cursor = -1
             self.refresh_article()
 
@@ -399,6 +636,7 @@ class ArticleReaderScreen(Screen):
             self.article = self.article_list[self.current_index]
             self.highlights = []
             self._paragraphs = []
+            self._paragraph_offsets = []
             self._cursor = -1
             self.refresh_article()
 
@@ -406,12 +644,16 @@ class ArticleReaderScreen(Screen):
         """Refresh display with new article."""
         # Scroll the markdown viewer to top
         try:
-            content_view = self.query_one("#article_content", LinkableMarkdownViewer)
+            content_view = self._content_view
             content_view.scroll_home(animate=False)
         except Exception:
             pass  # Widget may not be mounted yet
 
-        # Load new article content
+        # Load new article content. While a load is in flight, repeated J/K
+        # presses collapse into one load of the article the user ends up on
+        if self.is_loading:
+            self._reload_pending = True
+            return
         self.load_article_content()
 
     async def action_archive(self) -> None:
@@ -436,40 +678,62 @@ class ArticleReaderScreen(Screen):
             self.notify("API client not available", severity="error")
             return
 
-        client = self.app.client  # type: ignore
+        app = cast("RWReader", self.app)
+        client = app.client
         article_id = str(self.article.get("id"))
 
-        success, message = move_article_to_destination(
-            client=client, article_id=article_id, destination=destination
+        # Run the blocking API call off the event loop
+        loop = asyncio.get_running_loop()
+        success, message = await loop.run_in_executor(
+            app.api_executor,
+            partial(
+                move_article_to_destination,
+                client=client,
+                article_id=article_id,
+                destination=destination,
+            ),
         )
 
-        if success:
-            self.notify(message, title="Success")
-            if self.category != destination:
-                logger.debug(
-                    f"Removing article at index {self.current_index} from list of {len(self.article_list)} articles"
-                )
-                removed_article = self.article_list.pop(self.current_index)
-                logger.debug(
-                    f"After removal: {len(self.article_list)} articles remaining"
-                )
-                logger.debug(
-                    f"Removed '{removed_article.get('title', 'Unknown')[:30]}', {len(self.article_list)} left"
-                )
-                if self.current_index >= len(self.article_list):
-                    self.current_index = len(self.article_list) - 1
-                if len(self.article_list) > 0:
-                    self.article = self.article_list[self.current_index]
-                    self.refresh_article()
-                else:
-                    self.notify("No more articles", title="Info")
-                    self.dismiss({"articles": list(self.article_list)})
-            else:
-                logger.debug(
-                    f"Article moved to {destination} which is same as current category {self.category}, not removing from list"
-                )
-        else:
+        if not success:
             self.notify(message, severity="error")
+            return
+        # Cached renderings still show the old category
+        app.forget_markdown(article_id)
+        if self.category != destination:
+            self._remove_current_and_advance(message)
+        else:
+            self.notify(message, title="Success")
+            logger.debug(
+                "Article moved to %s which is same as current category %s,"
+                " not removing from list",
+                destination,
+                self.category,
+            )
+
+    def _remove_current_and_advance(self, success_msg: str) -> None:
+        """Drop the current article from the list and show the next one.
+
+        Returns to the article list when no articles remain.
+
+        Args:
+            success_msg: Message to notify the user with
+        """
+        self.notify(success_msg, title="Success")
+        removed_article = self.article_list.pop(self.current_index)
+        self.revision += 1
+        logger.debug(
+            "Removed '%.30s' at index %d, %d articles remaining",
+            removed_article.get("title", "Unknown"),
+            self.current_index,
+            len(self.article_list),
+        )
+        if not self.article_list:
+            self.notify("No more articles", title="Info")
+            self._return_to_list()
+            return
+        self.current_index = min(self.current_index, len(self.article_list) - 1)
+        self.article = self.article_list[self.current_index]
+        self.refresh_article()
 
     @work
     async def action_delete(self) -> None:
@@ -488,24 +752,16 @@ class ArticleReaderScreen(Screen):
         if result and result.get("confirmed"):
             try:
                 if hasattr(self.app, "client"):
-                    client = self.app.client  # type: ignore
-                    client.delete_article(article_id=article_id)
-                    self.notify("Article deleted", title="Success")
-
-                    # Remove from article list
-                    self.article_list.pop(self.current_index)
-                    # Adjust index if needed
-                    if self.current_index >= len(self.article_list):
-                        self.current_index = len(self.article_list) - 1
-                    # Load next article or go back if list is empty
-                    if len(self.article_list) > 0:
-                        self.article = self.article_list[self.current_index]
-                        self.refresh_article()
-                    else:
-                        self.notify("No more articles", title="Info")
-                        self.dismiss({"articles": list(self.article_list)})
+                    app = cast("RWReader", self.app)
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(
+                        app.api_executor,
+                        partial(app.client.delete_article, article_id=article_id),
+                    )
+                    app.forget_markdown(article_id)
+                    self._remove_current_and_advance("Article deleted")
             except Exception as e:
-                logger.error(f"Error deleting article: {e}")
+                logger.error("Error deleting article: %s", e)
                 self.notify(f"Error: {e}", severity="error")
 
     def action_open_browser(self) -> None:
@@ -513,10 +769,12 @@ class ArticleReaderScreen(Screen):
         url = self.article.get("url")
         if url:
             try:
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url)
                 self.notify("Opening in browser", title="Browser")
             except Exception as e:
-                logger.error(f"Error opening browser: {e}")
+                logger.error("Error opening browser: %s", e)
                 self.notify(f"Error: {e}", severity="error")
         else:
             self.notify("No URL available", severity="warning")
@@ -526,25 +784,25 @@ class ArticleReaderScreen(Screen):
         url = self.article.get("source_url")
         if url:
             try:
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url)
                 self.notify("Opening source URL in browser", title="Browser")
             except Exception as e:
-                logger.error(f"Error opening browser: {e}")
+                logger.error("Error opening browser: %s", e)
                 self.notify(f"Error: {e}", severity="error")
         else:
             self.notify("No source URL available", severity="warning")
 
     async def action_show_links(self) -> None:
         """Show links in the article."""
-        # Extract links from content
-        links = []
-
-        # Extract markdown links [text](url)
-        markdown_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-        for match in re.finditer(markdown_pattern, self.content_markdown):
-            text = match.group(1).strip()
-            url = match.group(2).strip()
-            links.append((text, url))
+        # Extract markdown links [text](url) once per article
+        if self._links is None:
+            self._links = [
+                (match.group(1).strip(), match.group(2).strip())
+                for match in _MARKDOWN_LINK_RE.finditer(self.content_markdown)
+            ]
+        links = self._links
 
         if not links:
             self.notify("No links found in article", title="Info")
@@ -554,7 +812,7 @@ class ArticleReaderScreen(Screen):
         from .link_screens import LinkSelectionScreen  # noqa: PLC0415
 
         if hasattr(self.app, "configuration"):
-            config = self.app.configuration  # type: ignore
+            config = cast("RWReader", self.app).configuration
             link_screen = LinkSelectionScreen(
                 links=links, configuration=config, open_links="browser"
             )
@@ -564,10 +822,13 @@ class ArticleReaderScreen(Screen):
 
     def action_back(self) -> None:
         """Return to article list, passing back the (possibly modified) article list."""
-        self.dismiss({"articles": list(self.article_list)})
+        self._return_to_list()
+
+    def _return_to_list(self) -> None:
+        """Dismiss the reader, handing the article list and its revision back."""
+        self.dismiss({"articles": list(self.article_list), "revision": self.revision})
 
     def action_help(self) -> None:
         """Show help screen."""
-        from .help import HelpScreen  # noqa: PLC0415
-
-        self.app.push_screen(HelpScreen())
+        # The app's registered "help" screen is built once and reused
+        self.app.push_screen("help")
@@ -1,19 +1,49 @@
 """Category list screen for Readwise Reader."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Sequence
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, ListItem, ListView, Static
 
 if TYPE_CHECKING:
-    pass
+    from ...client import ReadwiseClient
+    from .article_list import ArticleListScreen
 
 logger = logging.getLogger(__name__)
 
+# Category keys with the name (icon included) shown for each, in display order
+_CATEGORIES: tuple[tuple[str, str], ...] = (
+    ("inbox", "📥 Inbox"),
+    ("later", "⏰ Later"),
+    ("feed", "📰 Feed"),
+    ("archive", "📦 Archive"),
+)
+
+# Categories that show an article count
+_COUNTED_CATEGORIES = ("inbox", "feed", "later")
+
+# Seconds between frames of the title's refresh animation
+_REFRESH_ANIMATION_INTERVAL = 0.3
+
+# Seconds for which fetched articles are reused when opening a category
+_FETCHED_MAX_AGE = 60.0
+
+
+@cache
+def _article_list_screen_class() -> type["ArticleListScreen"]:
+    from .article_list import ArticleListScreen  # noqa: PLC0415
+
+    return ArticleListScreen
+
 
 class CategoryListScreen(Screen):
     """Screen showing all article categories."""
@@ -36,125 +66,153 @@ class CategoryListScreen(Screen):
         """
         super().__init__(**kwargs)
         self.categories: dict[str, int] = {}
+        # API client, taken from the app on mount
+        self._client: ReadwiseClient | None = None
+        # Label widget of each category row, and the counts they show
+        self._labels: dict[str, Static] = {}
+        self._rendered_counts: dict[str, int] = {}
+        # Articles from the last load and when they were fetched, handed to the
+        # article list so opening a category doesn't fetch it again
+        self._fetched: dict[str, list[dict[str, Any]]] = {}
+        self._fetched_at = 0.0
         self.is_refreshing = False
         self.refresh_animation_step = 0
+        self._refresh_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Create the category list UI."""
         yield Header(show_clock=True)
-        yield Static("Select a category to browse articles", id="title")
-        yield ListView(id="category_list")
+        self._title_widget = Static("Select a category to browse articles", id="title")
+        yield self._title_widget
+        self._list_view = ListView(id="category_list")
+        yield self._list_view
         yield Footer()
 
     async def on_mount(self) -> None:
         """Load categories when screen mounts."""
+        # The app creates its client before pushing the first screen
+        self._client = getattr(self.app, "client", None)
         self.load_categories()
 
     async def on_resume(self) -> None:
         """Refresh category counts when screen resumes."""
         logger.debug("CategoryListScreen resumed, refreshing counts")
+        # Articles may have been moved or deleted; don't seed lists with the
+        # old fetch until the refresh below replaces it
+        self._fetched = {}
         # Clear cache and trigger a background refresh to sync with server
-        if hasattr(self.app, "client"):
-            self.app.client.clear_cache()  # type: ignore
-        self.load_categories(refresh=True, use_retry=False)
+        self.load_categories(refresh=True, clear_cache_first=True, silent=True)
 
     def _update_refresh_animation(self) -> None:
         """Update the title with refresh animation."""
-        if not self.is_refreshing:
-            return
-
         # Create animated dots
         dots = "." * (self.refresh_animation_step % 4)
-        title_text = f"Select a category to browse articles - Refreshing{dots}"
-
-        # Update the title
-        title = self.query_one("#title", Static)
-        title.update(title_text)
+        self._title_widget.update(
+            f"Select a category to browse articles - Refreshing{dots}"
+        )
 
         # Increment animation step
         self.refresh_animation_step += 1
 
-        # Schedule next animation frame
-        if self.is_refreshing:
-            self.set_timer(0.3, self._update_refresh_animation)
-
     def _start_refresh_animation(self) -> None:
         """Start the refresh animation."""
         self.is_refreshing = True
         self.refresh_animation_step = 0
         self._update_refresh_animation()
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_interval(
+                _REFRESH_ANIMATION_INTERVAL, self._update_refresh_animation
+            )
 
     def _stop_refresh_animation(self) -> None:
         """Stop the refresh animation and restore title."""
         self.is_refreshing = False
-        title = self.query_one("#title", Static)
-        title.update("Select a category to browse articles")
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+        self._title_widget.update("Select a category to browse articles")
 
-    @work(exclusive=False, thread=True)
+    @work(exclusive=False)
     async def load_categories(
-        self, refresh: bool = False, use_retry: bool = False
+        self,
+        refresh: bool = False,
+        use_retry: bool = False,
+        clear_cache_first: bool = False,
+        silent: bool = False,
     ) -> None:
         """Load category counts from API.
 
         Args:
             refresh: Whether to force refresh from API (default: False)
             use_retry: Whether to use retry polling to handle server-side caching (default: False)
+            clear_cache_first: Whether to clear the client cache before fetching (default: False)
+            silent: Whether to skip the success notification, for background
+                refreshes the user didn't ask for (default: False)
         """
-        # Start refresh animation if refreshing (must be called from the main thread)
+        # Start refresh animation if refreshing
         if refresh:
-            self.app.call_from_thread(self._start_refresh_animation)
+            self._start_refresh_animation()
 
-        # Get API client from app
-        if not hasattr(self.app, "client"):
+        client = self._client
+        if client is None:
             logger.error("No client available")
-            self.app.call_from_thread(
-                self.notify, "API client not initialized", severity="error"
-            )
+            self.notify("API client not initialized", severity="error")
             if refresh:
-                self.app.call_from_thread(self._stop_refresh_animation)
+                self._stop_refresh_animation()
             return
 
         try:
-            logger.debug(f"load_categories called with refresh={refresh}")
+            logger.debug("load_categories called with refresh=%s", refresh)
 
             # Get counts for each category using the client's methods
-            client = self.app.client  # type: ignore
+            loop = asyncio.get_running_loop()
+            if clear_cache_first:
+                logger.debug("Clearing client cache")
+                await loop.run_in_executor(
+                    self.app.api_executor,  # type: ignore
+                    client.clear_cache,
+                )
 
             # Fetch data from API (or cache if not refreshing)
             # Use retry polling when requested to handle server-side caching
-            # These calls are synchronous but run in worker thread thanks to @work(thread=True)
             if use_retry:
                 logger.info("Using retry polling to fetch category data")
-                inbox_data = client.get_inbox_with_retry()
-                feed_data = client.get_feed_with_retry()
-                later_data = client.get_later_with_retry()
+                data = await self._fetch_all_with_retry(client, _COUNTED_CATEGORIES)
             else:
-                logger.debug("Fetching inbox data...")
-                inbox_data = client.get_inbox(refresh=refresh)
-                logger.debug(f"Got {len(inbox_data)} inbox items")
-
-                logger.debug("Fetching feed data...")
-                feed_data = client.get_feed(refresh=refresh)
-                logger.debug(f"Got {len(feed_data)} feed items")
-
-                logger.debug("Fetching later data...")
-                later_data = client.get_later(refresh=refresh)
-                logger.debug(f"Got {len(later_data)} later items")
+                # The blocking client calls are independent, so run them
+                # concurrently on the shared API executor
+                logger.debug("Fetching inbox, feed and later data...")
+                inbox_data, feed_data, later_data = await asyncio.gather(
+                    loop.run_in_executor(
+                        self.app.api_executor,  # type: ignore
+                        partial(client.get_inbox, refresh=refresh),
+                    ),
+                    loop.run_in_executor(
+                        self.app.api_executor,  # type: ignore
+                        partial(client.get_feed, refresh=refresh, filter_unread=True),
+                    ),
+                    loop.run_in_executor(
+                        self.app.api_executor,  # type: ignore
+                        partial(client.get_later, refresh=refresh),
+                    ),
+                )
+                data = {"inbox": inbox_data, "feed": feed_data, "later": later_data}
 
             # Calculate counts
-            inbox_count = len(inbox_data) if inbox_data else 0
-            # For feed, only count unread articles
-            feed_count = (
-                len([a for a in feed_data if a.get("first_opened_at") == ""])
-                if feed_data
-                else 0
-            )
-            later_count = len(later_data) if later_data else 0
+            inbox_count = len(data["inbox"]) if data["inbox"] else 0
+            # Feed data is already limited to unread articles by the client
+            feed_count = len(data["feed"]) if data["feed"] else 0
+            later_count = len(data["later"]) if data["later"] else 0
 
             logger.debug(
-                f"Calculated counts: inbox={inbox_count}, feed={feed_count}, later={later_count}"
+                "Calculated counts: inbox=%d, feed=%d, later=%d",
+                inbox_count,
+                feed_count,
+                later_count,
             )
 
+            self._fetched = data
+            self._fetched_at = time.monotonic()
             self.categories = {
                 "inbox": inbox_count,
                 "feed": feed_count,
@@ -162,89 +220,146 @@ class CategoryListScreen(Screen):
                 "archive": -1,  # Archive doesn't show count
             }
 
-            # Populate the list (must be called from main thread)
-            logger.debug("Populating list...")
-            self.app.call_from_thread(self.populate_list)
-            logger.debug("List populated successfully")
-
-            self.app.call_from_thread(self.notify, "Categories loaded", title="Success")
+            self.populate_list()
+            if not silent:
+                self.notify("Categories loaded", title="Success")
 
         except Exception as e:
-            logger.error(f"Error loading categories: {e}", exc_info=True)
-            self.app.call_from_thread(
-                self.notify, f"Error loading categories: {e}", severity="error"
-            )
+            logger.error("Error loading categories: %s", e, exc_info=True)
+            self.notify(f"Error loading categories: {e}", severity="error")
         finally:
-            # Stop refresh animation (must be called from main thread)
+            # Stop refresh animation
             if refresh:
-                self.app.call_from_thread(self._stop_refresh_animation)
+                self._stop_refresh_animation()
+
+    async def _fetch_all_with_retry(
+        self, client: "ReadwiseClient", categories: Sequence[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch several categories with retry polling, concurrently.
 
-    def _verify_counts(self) -> None:
-        """Background verification of category counts after initial load."""
-        logger.debug("Running background verification of category counts")
-        # Load again to check if counts have changed (server-side cache may have cleared)
-        self.load_categories(refresh=True, use_retry=False)
+        Each category polls and sleeps independently, so the total wait is
+        that of the slowest category rather than the sum.
+
+        Args:
+            client: Readwise client
+            categories: Category keys (inbox, feed, later)
+
+        Returns:
+            Mapping of category key to its articles
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.app.api_executor,  # type: ignore
+                    partial(self._fetch_with_retry, client, category),
+                )
+                for category in categories
+            )
+        )
+        return dict(zip(categories, results, strict=True))
+
+    @staticmethod
+    def _fetch_with_retry(
+        client: "ReadwiseClient", category: str
+    ) -> list[dict[str, Any]]:
+        """Fetch a category with retry polling to handle server-side caching.
+
+        Args:
+            client: Readwise client
+            category: Category key (inbox, feed, later)
+
+        Returns:
+            List of articles in the category
+        """
+        if category == "feed":
+            return client.get_feed_with_retry(filter_unread=True)
+        fetchers = {
+            "inbox": client.get_inbox_with_retry,
+            "later": client.get_later_with_retry,
+        }
+        return fetchers[category]()
 
     def populate_list(self) -> None:
-        """Populate the ListView with categories."""
+        """Populate the ListView with categories.
+
+        Once the rows exist only the labels whose counts changed are updated,
+        which keeps the current selection.
+        """
         try:
             logger.debug("populate_list called")
-            list_view = self.query_one("#category_list", ListView)
-
-            # Remove all existing items explicitly to avoid duplicate IDs
-            existing_count = len(list(list_view.children))
-            logger.debug(f"Removing {existing_count} existing items")
-            for child in list(list_view.children):
-                child.remove()
-
-            list_view.clear()
-            logger.debug("ListView cleared")
-
-            # Category icons and names
-            categories = [
-                ("inbox", "📥", "Inbox"),
-                ("later", "⏰", "Later"),
-                ("feed", "📰", "Feed"),
-                ("archive", "📦", "Archive"),
-            ]
-
-            logger.debug(f"Adding categories with counts: {self.categories}")
-            for category_id, icon, name in categories:
-                count = self.categories.get(category_id, 0)
-                if count >= 0:
-                    display_text = f"{icon} {name} ({count})"
-                else:
-                    display_text = f"{icon} {name}"
+            if self._labels:
+                self._update_counts()
+                return
+
+            list_view = self._list_view
 
-                logger.debug(f"Creating item for {category_id}: {display_text}")
+            logger.debug("Adding categories with counts: %s", self.categories)
+            items = []
+            for category_id, name in _CATEGORIES:
+                count = self.categories.get(category_id, 0)
+                label = Static(self._category_label(name, count), markup=False)
+                self._labels[category_id] = label
                 # Don't set explicit ID - let Textual auto-generate to avoid duplicate ID issues
-                item = ListItem(Static(display_text, markup=False))
+                item = ListItem(label)
                 item.data = {"category": category_id}  # type: ignore
-                list_view.append(item)
-                logger.debug(f"Appended item {category_id}")
+                items.append(item)
+            self._rendered_counts = dict(self.categories)
+
+            # Swap the rows and restore the selection in a single repaint
+            with self.app.batch_update():
+                list_view.clear()
+                logger.debug("ListView cleared")
 
-            # Focus the list and select first item
-            list_view.focus()
-            if len(list_view.children) > 0:
-                list_view.index = 0
-            logger.debug(f"List populated with {len(list_view.children)} items")
+                # Mount all rows in one pass
+                list_view.extend(items)
+
+                # Focus the list and select first item
+                list_view.focus()
+                if list_view.children:
+                    list_view.index = 0
+            logger.debug("List populated with %d items", len(list_view.children))
 
         except Exception as e:
-            logger.error(f"Error in populate_list: {e}", exc_info=True)
+            logger.error("Error in populate_list: %s", e, exc_info=True)
             raise
 
+    def _update_counts(self) -> None:
+        """Update the labels of categories whose counts changed since last shown."""
+        if self.categories == self._rendered_counts:
+            logger.debug("Category counts unchanged, nothing to update")
+            return
+        for category_id, name in _CATEGORIES:
+            count = self.categories.get(category_id, 0)
+            if self._rendered_counts.get(category_id) != count:
+                self._labels[category_id].update(self._category_label(name, count))
+        self._rendered_counts = dict(self.categories)
+
+    @staticmethod
+    def _category_label(name: str, count: int) -> str:
+        """Return the text shown for a category.
+
+        Args:
+            name: Display name of the category, including its icon
+            count: Number of articles, or -1 to hide the count
+
+        Returns:
+            Label text for the category row
+        """
+        return f"{name} ({count})" if count >= 0 else name
+
     def action_cursor_down(self) -> None:
         """Move cursor down."""
-        list_view = self.query_one(ListView)
-        list_view.action_cursor_down()
+        self._list_view.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
-        list_view = self.query_one(ListView)
-        list_view.action_cursor_up()
+        self._list_view.action_cursor_up()
 
     def _on_article_list_dismissed(self, result: dict | None) -> None:
         """Handle result from ArticleListScreen dismiss, updating category count immediately."""
+        # The list may have moved or deleted articles since the last fetch
+        self._fetched = {}
         if result and "category" in result and "count" in result:
             category = result["category"]
             count = result["count"]
@@ -252,23 +367,34 @@ class CategoryListScreen(Screen):
                 self.categories[category] = count
                 self.populate_list()
 
+    def _article_list_screen(self, category: str) -> "ArticleListScreen":
+        """Create the article list screen for a category.
+
+        Args:
+            category: Category key (inbox, later, feed, archive)
+
+        Returns:
+            ArticleListScreen, seeded with recently fetched articles if any
+        """
+        articles = None
+        if time.monotonic() - self._fetched_at < _FETCHED_MAX_AGE:
+            articles = self._fetched.get(category)
+        return _article_list_screen_class()(category=category, articles=articles)
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle ListView item selection (Enter key)."""
         # Get the selected item's data
         if event.item and hasattr(event.item, "data") and event.item.data:
             category = event.item.data.get("category")  # type: ignore
             if category:
-                # Import and push ArticleListScreen
-                from .article_list import ArticleListScreen  # noqa: PLC0415
-
                 self.app.push_screen(
-                    ArticleListScreen(category=category),
+                    self._article_list_screen(category),
                     self._on_article_list_dismissed,
                 )
 
     async def action_select_category(self) -> None:
         """Select category and push article list screen (fallback)."""
-        list_view = self.query_one(ListView)
+        list_view = self._list_view
         if list_view.highlighted_child:
             # Extract category name from ListItem data
             if (
@@ -277,11 +403,8 @@ class CategoryListScreen(Screen):
             ):
                 category = list_view.highlighted_child.data.get("category")  # type: ignore
                 if category:
-                    # Import and push ArticleListScreen
-                    from .article_list import ArticleListScreen  # noqa: PLC0415
-
                     self.app.push_screen(
-                        ArticleListScreen(category=category),
+                        self._article_list_screen(category),
                         self._on_article_list_dismissed,
                     )
 
@@ -289,21 +412,16 @@ class CategoryListScreen(Screen):
         """Refresh category counts."""
         logger.info("action_refresh called")
 
-        # Clear the client cache and reload (don't clear the list - let refresh happen in background)
-        if hasattr(self.app, "client"):
-            logger.debug("Clearing client cache")
-            self.app.client.clear_cache()  # type: ignore
-
-        # Load fresh data from API (will show animation in title)
+        # Clear the client cache and reload in the background (don't clear the
+        # list; the loading worker shows an animation in the title)
         logger.debug("Calling load_categories with refresh=True")
-        self.load_categories(refresh=True)
+        self.load_categories(refresh=True, clear_cache_first=True)
         logger.debug("action_refresh completed")
 
     def action_help(self) -> None:
         """Show help screen."""
-        from .help import HelpScreen  # noqa: PLC0415
-
-        self.app.push_screen(HelpScreen())
+        # The app's registered "help" screen is built once and reused
+        self.app.push_screen("help")
 
     def action_toggle_dark(self) -> None:
         """Toggle dark mode."""
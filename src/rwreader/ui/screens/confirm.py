@@ -8,6 +8,15 @@ from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, Static
 
+# Longest article title shown in the delete confirmation
+_DELETE_TITLE_MAX_CHARS = 50
+
+_DELETE_MSG_TMPL = (
+    "Are you sure you want to delete this article?\n\n"
+    "**{title}**\n\n"
+    "This action cannot be undone."
+)
+
 
 class ConfirmScreen(ModalScreen):
     """Modal screen for confirming actions like deletion."""
@@ -93,14 +102,15 @@ class DeleteArticleScreen(ConfirmScreen):
             article_title: Title of the article for the confirmation message
         """
         # Truncate title if too long
-        if len(article_title) > 50:  # noqa: PLR2004
-            display_title: str = article_title[:47] + "..."
-        else:
-            display_title = article_title
+        display_title = (
+            article_title[: _DELETE_TITLE_MAX_CHARS - 3] + "..."
+            if len(article_title) > _DELETE_TITLE_MAX_CHARS
+            else article_title
+        )
 
         super().__init__(
             title="Delete Article",
-            message=f"Are you sure you want to delete this article?\n\n**{display_title}**\n\nThis action cannot be undone.",
+            message=_DELETE_MSG_TMPL.format(title=display_title),
             data=article_id,
             variant="error",
         )
@@ -4,6 +4,9 @@ from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import MarkdownViewer
 
+# Keys that scroll the help text instead of closing it
+_NAV_KEYS: frozenset[str] = frozenset({"up", "down", "page_up", "page_down"})
+
 HELP_TEXT = """# Readwise Reader TUI Help
 
 ## Navigation Model
@@ -89,6 +92,6 @@ class HelpScreen(Screen):
     def on_key(self, event) -> None:
         """Handle key presses on the help screen."""
         # Close the help screen on any key press except navigation keys
-        if event.key not in ["up", "down", "page_up", "page_down"]:
+        if event.key not in _NAV_KEYS:
             event.prevent_default()
             self.app.pop_screen()
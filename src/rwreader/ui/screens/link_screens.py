@@ -2,7 +2,6 @@
 
 import logging
 import re
-import webbrowser
 from pathlib import Path
 from typing import Any
 from urllib.parse import ParseResult, urlparse
@@ -38,6 +37,7 @@ class LinkSelectionScreen(ModalScreen):
         self.open: bool = open
         self.configuration: Any = configuration
         self.selected_index = 0
+        self._link_list: ListView | None = None
         self.http_client = httpx.Client(follow_redirects=True)
 
     def compose(self) -> ComposeResult:
@@ -58,21 +58,16 @@ class LinkSelectionScreen(ModalScreen):
             yield Label("No links found in article")
             return
 
-        # Create a list view with all links
+        # Create a list view with all links, formatting each link once
+        labels: list[str] = [self._format_link_item(link=link) for link in self.links]
         link_select = ListView(
-            *[
-                ListItem(Label(self._format_link_item(link=link)))
-                for link in self.links
-            ],
+            *[ListItem(Label(label)) for label in labels],
             id="link-list",
         )
+        self._link_list = link_select
 
         # Calculate width based on longest link
-        longest_link: int = (
-            max(len(self._format_link_item(link)) for link in self.links)
-            if self.links
-            else 40
-        )
+        longest_link: int = max(len(label) for label in labels)
 
         link_select.styles.align_horizontal = "left"
         link_select.styles.width = min(longest_link + 6, 120)
@@ -81,10 +76,8 @@ class LinkSelectionScreen(ModalScreen):
 
     def on_mount(self) -> None:
         """Set focus to the list view when screen is mounted."""
-        link_list: ListView = self.query_one(
-            selector="#link-list", expect_type=ListView
-        )
-        link_list.focus()
+        if self._link_list is not None:
+            self._link_list.focus()
 
     def on_unmount(self) -> None:
         """Clean up HTTP client when screen is unmounted."""
@@ -174,10 +167,8 @@ class LinkSelectionScreen(ModalScreen):
 
     def action_select(self) -> None:
         """Process the selected link."""
-        link_list: ListView = self.query_one(
-            selector="#link-list", expect_type=ListView
-        )
-        if link_list.index is None or not self.links:
+        link_list = self._link_list
+        if link_list is None or link_list.index is None or not self.links:
             self.notify(
                 title="Error", message="No link selected", timeout=3, severity="error"
             )
@@ -223,6 +214,8 @@ class LinkSelectionScreen(ModalScreen):
             link: The URL to process
         """
         if self.open_links == "browser":
+            import webbrowser  # noqa: PLC0415
+
             webbrowser.open(url=link)
             self.notify(title="Opening", message="Opening link in browser", timeout=3)
         elif self.open_links == "download":
@@ -336,6 +329,8 @@ class LinkSelectionScreen(ModalScreen):
                     timeout=5,
                 )
                 if self.open:
+                    import webbrowser  # noqa: PLC0415
+
                     webbrowser.open(url=response.url)
             else:
                 self.notify(
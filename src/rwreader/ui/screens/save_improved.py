@@ -29,7 +29,9 @@ class SaveImprovedScreen(ModalScreen[dict]):
         Args:
             original_url: Original article source URL
             readwise_url: Link to original Readwise document
-            content_preview: Preview of content to be saved
+            content_preview: Preview of content to be saved. Only the first
+                CONTENT_PREVIEW_LENGTH + 1 characters are used, so callers can
+                slice the article text instead of passing all of it
         """
         super().__init__()
         self.original_url = original_url
@@ -43,18 +45,20 @@ class SaveImprovedScreen(ModalScreen[dict]):
 
     def compose(self) -> ComposeResult:
         """Compose the dialog layout."""
-        yield Static("Save Improved Version to Readwise", id="title")
+        yield Static("Save Improved Version to Readwise", id="title", markup=False)
         with Vertical(id="content"):
-            yield Label(f"Original URL: {self.original_url}")
+            yield Label(f"Original URL: {self.original_url}", markup=False)
             yield Label("")
-            yield Label("This will create a new document with:")
-            yield Label("• Modified URL: [original]?source=rwreader-improved")
-            yield Label("• Cleaned HTML content")
-            yield Label("• Link to original in summary")
-            yield Label("• Tags: rwreader, improved")
+            yield Label("This will create a new document with:", markup=False)
+            yield Label(
+                "• Modified URL: [original]?source=rwreader-improved", markup=False
+            )
+            yield Label("• Cleaned HTML content", markup=False)
+            yield Label("• Link to original in summary", markup=False)
+            yield Label("• Tags: rwreader, improved", markup=False)
             yield Label("")
-            yield Label("Preview:")
-            yield Static(self.content_preview, id="preview")
+            yield Label("Preview:", markup=False)
+            yield Static(self.content_preview, id="preview", markup=False)
             yield Label("")
             with Horizontal(id="buttons"):
                 yield Button("Save", variant="primary", id="save")
@@ -5,6 +5,12 @@ import time
 from textual.timer import Timer
 from textual.widgets import Static
 
+_NS_PER_SECOND = 1_000_000_000
+
+_RATE_LIMIT_MSG_TMPL = (
+    "API rate limit reached. Please wait {secs} seconds before continuing."
+)
+
 
 class APIStatusWidget(Static):
     """Widget that displays API rate limit status."""
@@ -44,11 +50,15 @@ class APIStatusWidget(Static):
         """Initialize the widget."""
         # Initialize with empty string and markup disabled
         super().__init__(content="", name=name, markup=False)
-        self.retry_time = 0.0
+        # time.monotonic_ns() at which the rate limit ends, and the seconds
+        # left as last shown
+        self._retry_deadline_ns = 0
+        self._last_shown_secs = -1
         self.status: str = "hidden"
-        self._update_timer: Timer = self.set_interval(
-            interval=1, callback=self._update_countdown
-        )
+        # Message currently shown
+        self._message = ""
+        # Countdown timer, only running while a rate limit is shown
+        self._update_timer: Timer | None = None
 
     # Update all methods that call update() to escape square brackets if needed
     def show_rate_limit(self, retry_after: int, message: str | None = None) -> None:
@@ -58,22 +68,34 @@ class APIStatusWidget(Static):
             retry_after: Seconds until retry is allowed
             message: Optional custom message
         """
-        self.retry_time = time.time() + retry_after
+        self._retry_deadline_ns = time.monotonic_ns() + retry_after * _NS_PER_SECOND
+        self._last_shown_secs = retry_after
         if message is None:
-            message = f"API rate limit reached. Please wait {retry_after} seconds before continuing."
-        self.update(content=message)
-        self.add_class("warning")
-        self.status = "warning"
+            message = _RATE_LIMIT_MSG_TMPL.format(secs=retry_after)
+        self._show(message, "warning")
+        if self._update_timer is None:
+            self._update_timer = self.set_interval(
+                interval=1, callback=self._update_countdown
+            )
+
+    def _stop_countdown(self) -> None:
+        """Stop the countdown timer, if running."""
+        if self._update_timer is not None:
+            self._update_timer.stop()
+            self._update_timer = None
 
     def _update_countdown(self) -> None:
         """Update the countdown timer if showing a rate limit warning."""
-        if self.retry_time is not None:
-            remaining: float = max(0, self.retry_time - time.time())
-            if remaining <= 0:
-                self.hide()
-            else:
-                message: str = f"API rate limit reached. Please wait {int(remaining)} seconds before continuing."
-                self.update(content=message)
+        remaining_ns = self._retry_deadline_ns - time.monotonic_ns()
+        if remaining_ns <= 0:
+            self.hide()
+            return
+        # Round up so the warning stays until the limit has actually ended
+        secs = -(-remaining_ns // _NS_PER_SECOND)
+        if secs == self._last_shown_secs:
+            return
+        self._last_shown_secs = secs
+        self._show(_RATE_LIMIT_MSG_TMPL.format(secs=secs), "warning")
 
     def show_error(self, message: str) -> None:
         """Show an error message.
@@ -81,12 +103,9 @@ class APIStatusWidget(Static):
         Args:
             message: Error message to display
         """
-        self.retry_time = 0.0
-        self.update(content=message)
-        self.add_class("error")
-        self.remove_class("warning")
-        self.remove_class("info")
-        self.status = "error"
+        self._retry_deadline_ns = 0
+        self._stop_countdown()
+        self._show(message, "error")
 
     def show_info(self, message: str) -> None:
         """Show an informational message.
@@ -94,17 +113,38 @@ class APIStatusWidget(Static):
         Args:
             message: Information to display
         """
-        self.retry_time = 0.0
-        self.update(content=message)
-        self.add_class("info")
-        self.remove_class("warning")
-        self.remove_class("error")
-        self.status = "info"
+        self._retry_deadline_ns = 0
+        self._stop_countdown()
+        self._show(message, "info")
 
     def hide(self) -> None:
         """Hide the status widget."""
-        self.retry_time = 0.0
-        self.remove_class("warning")
-        self.remove_class("error")
-        self.remove_class("info")
-        self.status = "hidden"
+        self._retry_deadline_ns = 0
+        self._stop_countdown()
+        self._set_status("hidden")
+
+    def _show(self, message: str, status: str) -> None:
+        """Display a message with the given status, skipping unchanged parts.
+
+        Args:
+            message: Message to display
+            status: Status (warning, error, info), also the CSS class to apply
+        """
+        if message != self._message:
+            self._message = message
+            self.update(content=message)
+        self._set_status(status)
+
+    def _set_status(self, status: str) -> None:
+        """Swap the status CSS class, leaving it alone when already set.
+
+        Args:
+            status: New status (warning, error, info or hidden)
+        """
+        if status == self.status:
+            return
+        if self.status != "hidden":
+            self.remove_class(self.status)
+        if status != "hidden":
+            self.add_class(status)
+        self.status = status
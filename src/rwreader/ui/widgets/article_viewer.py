@@ -1,7 +1,6 @@
 """Custom article viewer widget for rwreader."""
 
 import logging
-import webbrowser
 
 from textual import on
 from textual.widgets import Markdown, MarkdownViewer
@@ -24,6 +23,8 @@ class ArticleViewer(MarkdownViewer):
             markdown = "# Welcome to Readwise Reader\n\nNo content selected."
 
         super().__init__(markdown=markdown, show_table_of_contents=False, **kwargs)
+        # Markdown currently shown, to skip re-parsing identical content
+        self._current_markdown: str | None = markdown
 
     def update_content(self, markdown: str) -> None:
         """Update the article content.
@@ -36,18 +37,14 @@ class ArticleViewer(MarkdownViewer):
             if not markdown:
                 markdown = "# Content Not Available\n\nThe article content could not be loaded."
 
+            if markdown == self._current_markdown:
+                return
             self.document.update(markdown=markdown)
+            self._current_markdown = markdown
         except Exception as e:
-            logger.error(msg=f"Error updating article content: {e}")
-            # Attempt to set a simple error message as fallback
-            try:
-                self.document.update(
-                    markdown="**Error loading content**\n\nPlease try again or check logs."
-                )
-            except Exception as nested_e:
-                logger.error(
-                    msg=f"Failed to set error message in article viewer: {nested_e}"
-                )
+            # A fallback message would go through the same failing document
+            logger.error("Error updating article content: %s", e)
+            self._current_markdown = None
 
     @on(message_type=Markdown.LinkClicked)
     def handle_link_click(self, event: Markdown.LinkClicked) -> None:
@@ -59,10 +56,12 @@ class ArticleViewer(MarkdownViewer):
         if event.href:
             try:
                 event.prevent_default()
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url=event.href)
                 self.app.notify(message=f"Opening: {event.href}", title="Browser")
             except Exception as e:
-                logger.error(msg=f"Error opening link: {e}")
+                logger.error("Error opening link: %s", e)
                 self.app.notify(
                     message=f"Error opening link: {e}", title="Error", severity="error"
                 )
@@ -2,27 +2,29 @@
 
 import logging
 import re
-import webbrowser
 from typing import ClassVar
 
 from textual import on
+from textual.await_complete import AwaitComplete
 from textual.binding import Binding
 from textual.widgets import Markdown, MarkdownViewer
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 # Keys allowed in fullscreen mode for navigation
-ALLOW_IN_FULL_SCREEN: list[str] = [
-    "arrow_up",
-    "arrow_down",
-    "page_up",
-    "page_down",
-    "down",
-    "up",
-    "right",
-    "left",
-    "enter",
-]
+ALLOW_IN_FULL_SCREEN: frozenset[str] = frozenset(
+    {
+        "arrow_up",
+        "arrow_down",
+        "page_up",
+        "page_down",
+        "down",
+        "up",
+        "right",
+        "left",
+        "enter",
+    }
+)
 
 
 class LinkableMarkdownViewer(MarkdownViewer):
@@ -50,6 +52,12 @@ class LinkableMarkdownViewer(MarkdownViewer):
         # Track extracted links
         self.extracted_links: list[tuple[str, str]] = []
 
+        # Markdown currently displayed, used to skip redundant updates
+        self._current_markdown: str | None = kwargs.get("markdown")
+
+        # Completion of the last document update, awaited before appending
+        self._update_done: AwaitComplete | None = None
+
         # Extract links when markdown is set
         if kwargs.get("markdown"):
             self.extracted_links = self.extract_links(markdown_text=kwargs["markdown"])
@@ -92,13 +100,20 @@ class LinkableMarkdownViewer(MarkdownViewer):
             if not markdown:
                 markdown = "# Content Not Available\n\nThe article content could not be loaded."
 
+            # Re-parsing identical markdown would only repaint the same content
+            if markdown == self._current_markdown:
+                return
+
             # Update the document
-            self.document.update(markdown=markdown)
+            self._update_done = self.document.update(markdown=markdown)
+            self._current_markdown = markdown
 
             # Re-extract links from the new content
             self.extracted_links = self.extract_links(markdown_text=markdown)
         except Exception as e:
             logger.error(msg=f"Error updating markdown content: {e}")
+            self._current_markdown = None
+            self._update_done = None
             # Attempt to set a simple error message as fallback
             try:
                 self.document.update(
@@ -109,6 +124,31 @@ class LinkableMarkdownViewer(MarkdownViewer):
                     msg=f"Failed to set error message in markdown viewer: {nested_e}"
                 )
 
+    async def append_content(self, markdown: str, after: str) -> None:
+        """Append markdown to the content without re-parsing what is shown.
+
+        Waits for the pending update to finish first: Markdown.append() only
+        parses from the last line the document has parsed, so appending while
+        an update is still being parsed would add that content twice.
+
+        Args:
+            markdown: Markdown to add at the end of the document
+            after: The content being continued; nothing is appended if the
+                viewer has been updated with something else in the meantime
+        """
+        try:
+            if self._update_done is not None:
+                await self._update_done
+            if self._current_markdown is not after:
+                return
+            appended = self.document.append(markdown)
+            self._current_markdown = after + markdown
+            self.extracted_links.extend(self.extract_links(markdown_text=markdown))
+            await appended
+        except Exception as e:
+            logger.error(msg=f"Error appending markdown content: {e}")
+            self._current_markdown = None
+
     def action_scroll_down(self) -> None:
         """Scroll down in the markdown viewer (j key)."""
         # Call parent's scroll_down action
@@ -131,6 +171,8 @@ class LinkableMarkdownViewer(MarkdownViewer):
 
             if self.open_links:
                 # Open directly in browser
+                import webbrowser  # noqa: PLC0415
+
                 webbrowser.open(url=event.href)
                 # Notify the user
                 if hasattr(self.app, "notify"):
@@ -98,7 +98,7 @@ def render_html_to_markdown(html_content: str) -> str:  # noqa: PLR0911, PLR0912
                 if classes:
                     for cls in classes:
                         if cls.startswith("language-"):
-                            language = cls.replace("language-", "")
+                            language = cls.removeprefix("language-")
                             break
 
                 if language:
@@ -12,14 +12,15 @@ from ..utils.markdown_converter import (
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
-_HTML_CONTENT_FIELDS: list[str] = [
+# Content fields in order of preference; HTML gives better rendering
+_HTML_CONTENT_FIELDS: tuple[str, ...] = (
     "html_content",
     "full_html",
     "html",
     "fullHtml",
     "webContent",
-]
-_PLAIN_CONTENT_FIELDS: list[str] = [
+)
+_PLAIN_CONTENT_FIELDS: tuple[str, ...] = (
     "content",
     "text",
     "full_text",
@@ -28,49 +29,62 @@ _PLAIN_CONTENT_FIELDS: list[str] = [
     "body",
     "articleContent",
     "fullText",
-]
-_EXCLUDED_FIELDS: set[str] = {"id", "title", "url", "author", "site_name"}
+)
+_EXCLUDED_FIELDS: frozenset[str] = frozenset(
+    {"id", "title", "url", "author", "site_name"}
+)
 _MIN_CONTENT_LENGTH = 100
+# Client method used to move an article to each destination
+_MOVE_METHODS: dict[str, str] = {
+    "archive": "move_to_archive",
+    "later": "move_to_later",
+    "inbox": "move_to_inbox",
+}
+_VALID_TEXT_STYLES: frozenset[str] = frozenset(
+    {"bold", "none", "italic", "underline", "strike", "reverse"}
+)
+
+
+def _first_text_field(article: dict[str, Any], fields: tuple[str, ...]) -> str | None:
+    """Return the first field holding a non-empty string, if any."""
+    return next(
+        (
+            field
+            for field in fields
+            if (value := article.get(field)) and isinstance(value, str)
+        ),
+        None,
+    )
 
 
 def _extract_article_content(
     article: dict[str, Any],
 ) -> tuple[str | None, str | None, str | None]:
-    """Extract content from article dict."""
-    html_content: str | None = None
-    plain_content: str | None = None
-    field_used: str | None = None
-
-    for field in _HTML_CONTENT_FIELDS:
-        if article.get(field) and isinstance(article[field], str) and article[field]:
-            html_content = article[field]
-            field_used = field
-            break
-
-    if not html_content:
-        for field in _PLAIN_CONTENT_FIELDS:
-            if (
-                article.get(field)
-                and isinstance(article[field], str)
-                and article[field]
-            ):
-                plain_content = article[field]
-                field_used = field
-                break
-
-    if not html_content and not plain_content:
-        largest_field: str | None = None
-        largest_size = 0
-        for field, value in article.items():
-            if isinstance(value, str) and len(value) > _MIN_CONTENT_LENGTH:
-                if field not in _EXCLUDED_FIELDS and len(value) > largest_size:
-                    largest_size = len(value)
-                    largest_field = field
-        if largest_field:
-            plain_content = article[largest_field]
-            field_used = largest_field
-
-    return html_content, plain_content, field_used
+    """Extract content from article dict.
+
+    Returns:
+        Tuple of (html_content, plain_content, field_used)
+    """
+    field_used = _first_text_field(article, _HTML_CONTENT_FIELDS)
+    if field_used:
+        return article[field_used], None, field_used
+
+    field_used = _first_text_field(article, _PLAIN_CONTENT_FIELDS)
+    if field_used:
+        return None, article[field_used], field_used
+
+    # Fall back to the largest string field that might contain content
+    largest_field: str | None = None
+    largest_size = 0
+    for field, value in article.items():
+        if isinstance(value, str) and len(value) > _MIN_CONTENT_LENGTH:
+            if field not in _EXCLUDED_FIELDS and len(value) > largest_size:
+                largest_size = len(value)
+                largest_field = field
+    if largest_field:
+        return None, article[largest_field], largest_field
+
+    return None, None, None
 
 
 def safe_set_text_style(item: Any, style: str) -> None:
@@ -80,22 +94,12 @@ def safe_set_text_style(item: Any, style: str) -> None:
         item: UI item to apply the style to
         style: Style to apply (e.g., "bold", "none", "italic")
     """
-    # Validate the style before applying
-    valid_styles: list[str] = [
-        "bold",
-        "none",
-        "italic",
-        "underline",
-        "strike",
-        "reverse",
-    ]
-
     # If style is None or empty, use "none" as default
     if not style:
         style = "none"
 
     # Only apply if it's a valid style
-    if style in valid_styles:
+    if style in _VALID_TEXT_STYLES:
         try:
             item.styles.text_style = style
         except Exception as e:
@@ -109,7 +113,71 @@ def safe_set_text_style(item: Any, style: str) -> None:
             logger.error(msg=f"Error setting fallback text style: {e}")
 
 
-def format_article_content(article: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
+def format_article_header(article: dict[str, Any]) -> str:
+    """Format the title and metadata block shown above an article's content.
+
+    Only uses list-level metadata, so it can be rendered before the full
+    article content has been fetched.
+
+    Args:
+        article: The article data dictionary
+
+    Returns:
+        Markdown header ending with a horizontal rule
+    """
+    # Bind the lookup once; the header reads a dozen fields
+    get = article.get
+    title: str = get("title", "Untitled")
+
+    # Get metadata with safe defaults
+    url: str = get("url", get("source_url", ""))
+    author: str = get("author", get("creator", ""))
+    site_name: str = get("site_name", get("domain", ""))
+    summary: str = get("summary", "")
+    published_date: str = format_timestamp(get("published_date", ""))
+    created_at: str = format_timestamp(get("created_at", ""))
+    updated_at: str = format_timestamp(get("updated_at", ""))
+    word_count: str | int = get("word_count", 0)
+
+    # Determine category
+    category: Literal["Archive"] | Literal["Later"] | Literal["Inbox"] = (
+        "Archive"
+        if get("archived", True)
+        else ("Later" if get("saved_for_later", False) else "Inbox")
+    )
+
+    parts: list[str] = [f"# {escape_markdown_formatting(text=title)}\n\n"]
+
+    # Add metadata
+    metadata: list[str] = []
+    if author:
+        metadata.append(f"*By {escape_markdown_formatting(author)}*")
+    if site_name:
+        metadata.append(f"*From {escape_markdown_formatting(site_name)}*")
+    if published_date:
+        metadata.append(f"*Published: {published_date}*")
+    if created_at:
+        metadata.append(f"*Added: {created_at}*")
+    if updated_at and updated_at != created_at:
+        metadata.append(f"*Updated: {updated_at}*")
+    if word_count and isinstance(word_count, int | float):
+        metadata.append(f"*{word_count} words*")
+    metadata.append(f"*Category: {category}*")
+
+    parts.append(" | ".join(metadata) + "\n\n")
+
+    if url:
+        parts.append(f"*[Original Article]({url})*\n\n")
+
+    if summary:
+        parts.append(f"**Summary**: {escape_markdown_formatting(summary)}\n\n")
+
+    parts.append("---\n\n")
+
+    return "".join(parts)
+
+
+def format_article_content(article: dict[str, Any]) -> str:  # noqa: PLR0912
     """Format article data into markdown content with enhanced error handling and fallbacks.
 
     Args:
@@ -119,77 +187,20 @@ def format_article_content(article: dict[str, Any]) -> str:  # noqa: PLR0912, PL
         Formatted markdown content
     """
     try:
-        # Extract article details with safe defaults
-        title: str = article.get("title", "Untitled")
-        content: str = ""
-
-        # Try different possible content fields with added debugging
-        html_content: str | None = None
-        content_field_used: str | None = None
-
-        # Define all possible content field names
-        html_content_fields: list[str] = [
-            "html_content",
-            "full_html",
-            "html",
-            "fullHtml",
-            "webContent",
-        ]
-        plain_content_fields: list[str] = [
-            "content",
-            "text",
-            "full_text",
-            "article_text",
-            "document",
-            "body",
-            "articleContent",
-            "fullText",
-        ]
-
-        # Try to find HTML content first (higher quality)
-        for field in html_content_fields:
-            if (
-                article.get(field)
-                and isinstance(article[field], str)
-                and len(article[field]) > 0
-            ):
-                html_content = article[field]
-                content_field_used = field
-                break
-
-        # If no HTML content found, try plain content fields
-        if not html_content:
-            for field in plain_content_fields:
-                if (
-                    article.get(field)
-                    and isinstance(article[field], str)
-                    and len(article[field]) > 0
-                ):
-                    content = article[field]
-                    content_field_used = field
-                    break
-
-        # If still no content found, try any field that might contain text
-        if not html_content and not content:
-            # Find the largest string field that might contain content
-            largest_field: str | None = None
-            largest_size = 0
-            for field, value in article.items():
-                if isinstance(value, str) and len(value) > 100:  # noqa: PLR2004
-                    if field not in ["id", "title", "url", "author", "site_name"]:
-                        if len(value) > largest_size:
-                            largest_size = len(value)
-                            largest_field = field
-
-            if largest_field:
-                content = article[largest_field]
-                content_field_used = largest_field
+        # Find the content field: HTML first, then plain text, then any large text
+        html_content, plain_content, content_field_used = _extract_article_content(
+            article
+        )
+        content: str = plain_content or ""
 
         # Last resort: check for raw attribute text
         if not html_content and not content and hasattr(article, "__dict__"):
             for attr_name, attr_value in article.__dict__.items():
-                if isinstance(attr_value, str) and len(attr_value) > 100:  # noqa: PLR2004
-                    if attr_name not in ["id", "title", "url", "author", "site_name"]:
+                if (
+                    isinstance(attr_value, str)
+                    and len(attr_value) > _MIN_CONTENT_LENGTH
+                ):
+                    if attr_name not in _EXCLUDED_FIELDS:
                         content = attr_value
                         content_field_used = f"__dict__.{attr_name}"
                         break
@@ -201,52 +212,7 @@ def format_article_content(article: dict[str, Any]) -> str:  # noqa: PLR0912, PL
         # Use html_content if available, otherwise use content
         raw_content = html_content if html_content else content
 
-        # Get metadata with safe defaults
-        url: str = article.get("url", article.get("source_url", ""))
-        author: str = article.get("author", article.get("creator", ""))
-        site_name: str = article.get("site_name", article.get("domain", ""))
-        summary: str = article.get("summary", "")
-        published_date: str = format_timestamp(article.get("published_date", ""))
-        created_at: str = format_timestamp(article.get("created_at", ""))
-        updated_at: str = format_timestamp(article.get("updated_at", ""))
-        word_count: str | int = article.get("word_count", 0)
-
-        # Determine category
-        category: Literal["Archive"] | Literal["Later"] | Literal["Inbox"] = (
-            "Archive"
-            if article.get("archived", True)
-            else ("Later" if article.get("saved_for_later", False) else "Inbox")
-        )
-
-        # Format markdown content
-        header: str = f"# {escape_markdown_formatting(text=title)}\n\n"
-
-        # Add metadata
-        metadata: list[str] = []
-        if author:
-            metadata.append(f"*By {escape_markdown_formatting(author)}*")
-        if site_name:
-            metadata.append(f"*From {escape_markdown_formatting(site_name)}*")
-        if published_date:
-            metadata.append(f"*Published: {published_date}*")
-        if created_at:
-            metadata.append(f"*Added: {created_at}*")
-        if updated_at and updated_at != created_at:
-            metadata.append(f"*Updated: {updated_at}*")
-        if word_count and isinstance(word_count, int | float):
-            metadata.append(f"*{word_count} words*")
-        metadata.append(f"*Category: {category}*")
-
-        if metadata:
-            header += " | ".join(metadata) + "\n\n"
-
-        if url:
-            header += f"*[Original Article]({url})*\n\n"
-
-        if summary:
-            header += f"**Summary**: {escape_markdown_formatting(summary)}\n\n"
-
-        header += "---\n\n"
+        header: str = format_article_header(article=article)
 
         # Convert HTML to markdown if content is in HTML format
         content_markdown: str = ""
@@ -313,6 +279,18 @@ def format_article_content(article: dict[str, Any]) -> str:  # noqa: PLR0912, PL
         return "# Error Formatting Content\n\nThere was an error preparing the article content. Please try again."
 
 
+def is_article_read(article: dict[str, Any]) -> bool:
+    """Return whether an article should be shown as read.
+
+    Args:
+        article: The article data dictionary
+
+    Returns:
+        True if the article is marked read or its reading state is finished
+    """
+    return bool(article.get("read", False)) or article.get("state") == "finished"
+
+
 def safe_get_article_display_title(article: dict[str, Any]) -> str:
     """Safely create a display title for an article with proper error handling.
 
@@ -327,12 +305,7 @@ def safe_get_article_display_title(article: dict[str, Any]) -> str:
         site_name: str = article.get("site_name", "")
 
         # Format the title with metadata
-        display_title: str = title
-
-        if site_name:
-            display_title += f" ({site_name})"
-
-        return display_title
+        return f"{title} ({site_name})" if site_name else title
     except Exception as e:
         logger.error(msg=f"Error creating display title: {e}")
         return "Article (Error loading title)"
@@ -403,14 +376,10 @@ def move_article_to_destination(
         return False, "API client not available"
 
     try:
-        if destination == "archive":
-            success = client.move_to_archive(article_id=article_id)
-        elif destination == "later":
-            success = client.move_to_later(article_id=article_id)
-        elif destination == "inbox":
-            success = client.move_to_inbox(article_id=article_id)
-        else:
+        method_name = _MOVE_METHODS.get(destination)
+        if method_name is None:
             return False, f"Unknown destination: {destination}"
+        success = getattr(client, method_name)(article_id=article_id)
 
         if success:
             return True, f"Moved to {destination.capitalize()}"
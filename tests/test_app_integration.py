@@ -97,7 +97,7 @@ def app_with_mock_client(monkeypatch):
     def get_inbox_mock(refresh=False, limit=None):
         return inbox_data
 
-    def get_feed_mock(refresh=False, limit=None):
+    def get_feed_mock(refresh=False, limit=None, filter_unread=False):
         return feed_data
 
     def get_later_mock(refresh=False, limit=None):
@@ -414,6 +414,33 @@ async def test_move_article_to_inbox(app_with_mock_client):
             app.client.move_to_inbox.assert_called()
 
 
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_moved_article_is_reformatted(app_with_mock_client):
+    """Test that a moved article is not rendered from its old cached markdown."""
+    app = app_with_mock_client
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+        # Serve each inbox article under its own ID so only article 1 is "1"
+        inbox = {article["id"]: article for article in app.client.get_inbox()}
+        app.client.get_article = Mock(side_effect=lambda article_id: inbox[article_id])
+
+        reader_screen = await navigate_to_article_reader(pilot, "inbox", 0)
+        article = dict(inbox["1"])
+        await reader_screen._format_article(article, timeout=5)
+        assert any(key[0] == "1" for key in app.markdown_cache)
+
+        await reader_screen._move_article("later")
+        await pilot.pause()
+        app.client.move_to_later.assert_called()
+        assert not any(key[0] == "1" for key in app.markdown_cache)
+
+        article.update(archived=False, saved_for_later=True)
+        markdown = await reader_screen._format_article(article, timeout=5)
+        assert "*Category: Later*" in markdown
+
+
 @pytest.mark.asyncio
 @pytest.mark.integration
 async def test_pane_navigation_with_tab(app_with_mock_client):
@@ -642,3 +669,74 @@ async def test_multiple_article_interactions(app_with_mock_client):
         await pilot.press("escape")
         await pilot.pause()
         assert isinstance(app.screen, CategoryListScreen)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_resume_with_large_category_fetches_once(app_with_mock_client):
+    """Test that returning from a category longer than one page makes no extra fetches."""
+    app = app_with_mock_client
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        category_screen = app.screen
+        assert isinstance(category_screen, CategoryListScreen)
+
+        # More articles than the list screen shows on its first page
+        inbox = [
+            {"id": f"big-{i}", "title": f"Article {i}", "location": "new"}
+            for i in range(30)
+        ]
+        app.client.get_inbox = Mock(return_value=inbox)
+        category_screen.load_categories(refresh=True)
+        await pilot.pause(0.3)
+
+        article_list = await navigate_to_article_list(pilot, "inbox")
+        assert len(article_list.articles) < len(inbox)
+        await pilot.press("escape")
+        await pilot.pause(0.2)
+        assert app.screen is category_screen
+
+        app.client.get_inbox.reset_mock()
+        await category_screen.on_resume()
+        await pilot.pause(0.5)
+
+        assert app.client.get_inbox.call_count == 1
+        app.client.get_inbox_with_retry.assert_not_called()
+        assert category_screen.categories["inbox"] == len(inbox)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_reopened_category_is_fetched_again(app_with_mock_client):
+    """Test that a category reopened after visiting it is not seeded from the old fetch."""
+    app = app_with_mock_client
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        category_screen = app.screen
+
+        await navigate_to_article_list(pilot, "inbox")
+        await pilot.press("escape")
+        await pilot.pause(0.2)
+        assert app.screen is category_screen
+        assert category_screen._fetched == {}
+
+        app.client.get_inbox.reset_mock()
+        await navigate_to_article_list(pilot, "inbox")
+        app.client.get_inbox.assert_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_load_more_without_client_can_be_retried(app_with_mock_client):
+    """Test that a load-more that finds no client does not block later ones."""
+    app = app_with_mock_client
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        article_list = await navigate_to_article_list(pilot, "inbox")
+
+        del app.client
+        article_list._loading_more = True
+        await article_list.load_articles(load_more=True).wait()
+        await pilot.pause()
+
+        assert article_list._loading_more is False
@@ -81,3 +81,48 @@ class TestParseParagraphs:
         assert len(result) == 1
         assert "Line one" in result[0]
         assert "Line two" in result[0]
+
+
+class TestLocateParagraphs:
+    """Tests for ArticleReaderScreen._locate_paragraphs (static method)."""
+
+    def test_offsets_match_find(self) -> None:
+        """Offsets point at each paragraph in the markdown."""
+        md = (
+            "# Title\n\n"
+            "First paragraph that is long enough to be included here.\n\n"
+            "Second paragraph that is also long enough to be included."
+        )
+        paragraphs = ArticleReaderScreen._parse_paragraphs(md)
+        offsets = ArticleReaderScreen._locate_paragraphs(md, paragraphs)
+        assert offsets == [md.find(p) for p in paragraphs]
+
+    def test_repeated_paragraph_gets_own_offset(self) -> None:
+        """A repeated paragraph maps to its second occurrence."""
+        para = "Repeated paragraph that is long enough to be included."
+        md = f"{para}\n\n{para}"
+        offsets = ArticleReaderScreen._locate_paragraphs(md, [para, para])
+        assert offsets == [0, len(para) + 2]
+
+
+class TestSyncReadStatus:
+    """Tests for ArticleReaderScreen._sync_read_status."""
+
+    def test_updates_entry_and_revision(self) -> None:
+        """A changed read state is copied into the list and bumps the revision."""
+        entry = {"id": "1", "read": False}
+        reader = ArticleReaderScreen(
+            article=entry, article_list=[entry], current_index=0, category="inbox"
+        )
+        reader._sync_read_status({"id": "1", "read": True})
+        assert entry["read"] is True
+        assert reader.revision == 1
+
+    def test_unchanged_state_keeps_revision(self) -> None:
+        """Fetching an article with the same read state leaves the revision alone."""
+        entry = {"id": "1", "read": True}
+        reader = ArticleReaderScreen(
+            article=entry, article_list=[entry], current_index=0, category="inbox"
+        )
+        reader._sync_read_status({"id": "1", "read": True})
+        assert reader.revision == 0
@@ -117,6 +117,39 @@ class TestReadwiseClient:
             assert len(articles) == 1
             mock_api.get_documents.assert_called_once_with(location="feed")
 
+    @patch("rwreader.client.ReadwiseReader")
+    def test_get_feed_filter_unread(
+        self, mock_api_class: Mock, mock_document: Mock
+    ) -> None:
+        """Test that the unread filter is applied before the limit."""
+        with patch.dict("os.environ", {}, clear=True):
+            read_document = Mock(
+                id="doc_read",
+                title="Read Article",
+                url="https://example.com/read",
+                author="",
+                site_name="",
+                word_count=0,
+                created_at="",
+                updated_at="",
+                published_date="",
+                summary="",
+                content="",
+                source_url="",
+                first_opened_at="2024-01-03T00:00:00Z",
+                last_opened_at="2024-01-03T00:00:00Z",
+                location="feed",
+                reading_progress=0,
+            )
+            mock_api = Mock()
+            mock_api_class.return_value = mock_api
+            mock_api.get_documents.return_value = [read_document, mock_document]
+
+            client = ReadwiseClient(token="test_token")
+            articles = client.get_feed(refresh=True, limit=1, filter_unread=True)
+
+            assert [article["id"] for article in articles] == ["doc_123"]
+
     @patch("rwreader.client.ReadwiseReader")
     def test_get_later(self, mock_api_class: Mock, mock_document: Mock) -> None:
         """Test getting later articles."""
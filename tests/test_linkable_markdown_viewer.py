@@ -0,0 +1,57 @@
+"""Tests for the LinkableMarkdownViewer widget."""
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets.markdown import MarkdownBlock
+
+from rwreader.ui.widgets.linkable_markdown_viewer import LinkableMarkdownViewer
+
+PARAGRAPH_COUNT = 400
+
+
+class ViewerApp(App):
+    """Minimal app hosting a single viewer."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield LinkableMarkdownViewer()
+
+
+@pytest.mark.asyncio
+async def test_append_content_right_after_update_adds_each_block_once() -> None:
+    """Appending before the update has been parsed must not repeat the head."""
+    markdown = "\n\n".join(
+        f"Paragraph number {i}. " + "word " * 20 for i in range(PARAGRAPH_COUNT)
+    )
+    split = markdown.rfind("\n\n", 0, len(markdown) // 3)
+    head = markdown[:split]
+
+    app = ViewerApp()
+    async with app.run_test() as pilot:
+        viewer = app.query_one(LinkableMarkdownViewer)
+        viewer.update_content(head)
+        await viewer.append_content(markdown[split:], after=head)
+        await pilot.pause()
+
+        blocks = [
+            child
+            for child in viewer.document.children
+            if isinstance(child, MarkdownBlock)
+        ]
+        assert len(blocks) == PARAGRAPH_COUNT
+        assert viewer.document.source == markdown
+
+
+@pytest.mark.asyncio
+async def test_append_content_skipped_after_newer_update() -> None:
+    """A pending append is dropped once the viewer shows something else."""
+    app = ViewerApp()
+    async with app.run_test() as pilot:
+        viewer = app.query_one(LinkableMarkdownViewer)
+        head = "First paragraph."
+        viewer.update_content(head)
+        viewer.update_content("Another article.")
+        await viewer.append_content("\n\nTail of the first article.", after=head)
+        await pilot.pause()
+
+        assert viewer.document.source == "Another article."
@@ -4,6 +4,9 @@ from unittest.mock import Mock, patch
 
 from rwreader.utils.ui_helpers import (
     format_article_content,
+    format_article_header,
+    is_article_read,
+    move_article_to_destination,
     safe_get_article_display_title,
     safe_parse_article_data,
     safe_set_text_style,
@@ -309,6 +312,50 @@ class TestFormatArticleContent:
         assert "First HTML" in result or "Multiple HTML Fields" in result
 
 
+class TestFormatArticleHeader:
+    """Test cases for format_article_header function."""
+
+    def test_header_without_content(self) -> None:
+        """Test header is built from list metadata only."""
+        article = {
+            "title": "Header Article",
+            "author": "John Doe",
+            "url": "https://example.com/article",
+        }
+        result = format_article_header(article)
+        assert result.startswith("# Header Article")
+        assert "John Doe" in result
+        assert "https://example.com/article" in result
+        assert result.endswith("---\n\n")
+
+    def test_header_prefixes_content(self) -> None:
+        """Test full formatting starts with the same header."""
+        article = {
+            "title": "Header Article",
+            "content": "This is plain text content without HTML tags.",
+        }
+        assert format_article_content(article).startswith(
+            format_article_header(article)
+        )
+
+
+class TestIsArticleRead:
+    """Test cases for is_article_read function."""
+
+    def test_read_flag(self) -> None:
+        """Test article with read flag set."""
+        assert is_article_read({"read": True}) is True
+
+    def test_finished_state(self) -> None:
+        """Test article with finished reading state."""
+        assert is_article_read({"state": "finished"}) is True
+
+    def test_unread_article(self) -> None:
+        """Test article with no read markers."""
+        assert is_article_read({"read": False, "state": "reading"}) is False
+        assert is_article_read({}) is False
+
+
 class TestSafeGetArticleDisplayTitle:
     """Test cases for safe_get_article_display_title function."""
 
@@ -458,3 +505,40 @@ class TestSafeParseArticleData:
         result = safe_parse_article_data(data)
         assert result["author"] == "John Doe"
         assert result["url"] == "https://example.com"
+
+
+class TestMoveArticleToDestination:
+    """Test cases for move_article_to_destination function."""
+
+    def test_dispatches_to_client_method(self) -> None:
+        """Test each destination calls the matching client method."""
+        for destination in ("archive", "later", "inbox"):
+            client = Mock()
+            getattr(client, f"move_to_{destination}").return_value = True
+            success, message = move_article_to_destination(
+                client=client, article_id="123", destination=destination
+            )
+            assert success is True
+            assert message == f"Moved to {destination.capitalize()}"
+            getattr(client, f"move_to_{destination}").assert_called_once_with(
+                article_id="123"
+            )
+
+    def test_unknown_destination(self) -> None:
+        """Test an unknown destination is rejected without an API call."""
+        client = Mock()
+        success, message = move_article_to_destination(
+            client=client, article_id="123", destination="feed"
+        )
+        assert success is False
+        assert "Unknown destination" in message
+
+    def test_failed_move(self) -> None:
+        """Test a failed client call is reported."""
+        client = Mock()
+        client.move_to_later.return_value = False
+        success, message = move_article_to_destination(
+            client=client, article_id="123", destination="later"
+        )
+        assert success is False
+        assert message == "Failed to move to later"